@@ -0,0 +1,69 @@
+# src/attacks/assignment.py
+from __future__ import annotations
+from typing import Tuple
+
+import numpy as np
+
+# Minimum-cost assignment (Hungarian method, shortest augmenting path with potentials), NumPy only
+# Same contract as scipy.optimize.linear_sum_assignment for finite costs: returns (rows, cols), rows sorted, one pair
+# per row of the smaller side; each augmenting step is vectorized over columns, O(n^2 m) work for n <= m
+def linear_sum_assignment(cost: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+	cost = np.asarray(cost, dtype=float)
+	if cost.ndim != 2:
+		raise ValueError("cost must be a 2-D matrix")
+	if not np.all(np.isfinite(cost)):
+		raise ValueError("cost must be finite")
+
+	transposed = cost.shape[0] > cost.shape[1]
+	if transposed:
+		cost = cost.T
+	n, m = cost.shape
+
+	# 1-based internals, index 0 is the virtual start column
+	u = np.zeros(n + 1)
+	v = np.zeros(m + 1)
+	row_of = np.zeros(m + 1, dtype=np.int64)  # row matched to column j, 0 = free
+	way = np.zeros(m + 1, dtype=np.int64)
+
+	for i in range(1, n + 1):
+		row_of[0] = i
+		j0 = 0
+		minv = np.full(m + 1, np.inf)
+		used = np.zeros(m + 1, dtype=bool)
+		while True:
+			used[j0] = True
+			i0 = row_of[j0]
+			free = ~used[1:]
+			reduced = cost[i0 - 1] - u[i0] - v[1:]
+			better = free & (reduced < minv[1:])
+			minv[1:][better] = reduced[better]
+			way[1:][better] = j0
+
+			# Among the cheapest free columns prefer an unmatched one, which ends the search at once (big win on ties)
+			masked = np.where(free, minv[1:], np.inf)
+			delta = masked.min()
+			cheapest = masked == delta
+			open_cheapest = np.flatnonzero(cheapest & (row_of[1:] == 0))
+			j1 = int(open_cheapest[0] if open_cheapest.size else np.argmax(cheapest)) + 1
+
+			tight = np.flatnonzero(used)
+			u[row_of[tight]] += delta
+			v[tight] -= delta
+			minv[1:][free] -= delta
+
+			j0 = j1
+			if row_of[j0] == 0:
+				break
+
+		# Flip the augmenting path back to the start column
+		while j0:
+			j1 = way[j0]
+			row_of[j0] = row_of[j1]
+			j0 = j1
+
+	cols = np.flatnonzero(row_of[1:])
+	rows = row_of[1:][cols] - 1
+	if transposed:
+		rows, cols = cols, rows
+	order = np.argsort(rows, kind="stable")
+	return rows[order].astype(np.int64), cols[order].astype(np.int64)
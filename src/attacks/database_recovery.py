@@ -1,61 +1,84 @@
 # src/attacks/database_recovery.py
 from __future__ import annotations
+import random
 from collections import defaultdict
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
 from src.attacks.padding import next_power_of_x
-from src.attacks.query_recovery import build_padded_size_buckets
-from src.attacks.types import EncryptedTuple, QueryObservation
+from src.attacks.streams import iter_observations
+from src.attacks.query_recovery import build_live_size_buckets
+from src.attacks.sampling import SwapRemovePools
+from src.attacks.types import EncryptedTable, EncryptedTuple, QueryObservation
 
 # SEAL database recovery attack adapted to this setting
 # Attacker steps:
 # 1) Guess the queried plaintext value q0 using volume
 # 2) For each returned tuple prefix in Sq: pick a random encrypted tuple from enc(T) that has same alpha-prefix and "map" guessed value to it
 # 3) Count correct mappings
+# Both draws use swap-remove pools (one randrange per draw), live order changes as tuples are removed, so a seed
+# gives a different stream than the original pop-from-list pools, with the same per-draw distribution
+# Step 2 works per distinct returned prefix (ascending), drawing min(count, live) tuples in one batch, for both the
+# list and the compact observation form; a seed therefore gives the same DRSR for either form, but a different
+# stream than mapping tuples in returned-list order (again with the same distribution)
+# Resumable: state (live pools, rng, running counts) persists across observe calls, `rate` is DRSR so far
+class DatabaseRecoveryAttacker:
+	def __init__(
+		self,
+		value_counts: Dict[Any, int],
+		encrypted_tuples: Union[List[EncryptedTuple], EncryptedTable],
+		x: Optional[int] = None,
+		rng_seed: int = 1234,
+	):
+		self._rnd = random.Random(rng_seed)
+
+		# Bucket values by padded size
+		self._size_buckets = build_live_size_buckets(value_counts, x)
+
+		# We'll remove tuples from enc(T) as the attack assigns them; only a tuple's value matters for scoring,
+		# so each live pool holds the values of the tuples with that alpha_prefix, drawn with O(1) swap-remove
+		self._live_by_prefix = _prefix_pools(encrypted_tuples)
+
+		self.correct = 0
+		self.denom = 0
+
+	def observe(self, true_value: Any, obs: QueryObservation) -> None:
+		# Step 1: guess the query plaintext value
+		guess = self._size_buckets.draw(obs.observed_volume, self._rnd)
+
+		# Step 2: map returned tuples, a batch per prefix; tuples beyond what is left with that prefix can't be mapped
+		prefixes, counts = obs.prefix_histogram()
+		for prefix, count in zip(prefixes.tolist(), counts.tolist()):
+			self.denom += count
+			chosen = self._live_by_prefix.draw_many(prefix, count, self._rnd)  # remove from enc(T)
+			if guess is not None:
+				self.correct += chosen.count(guess)
+
+	def observe_all(self, observations: Iterable[Tuple[Any, QueryObservation]]) -> None:
+		for true_value, obs in iter_observations(observations):
+			self.observe(true_value, obs)
+
+	@property
+	def rate(self) -> float:
+		return self.correct / self.denom if self.denom else 0.0
+
 def database_recovery_attack(
 	value_counts: Dict[Any, int],
-	encrypted_tuples: List[EncryptedTuple],
+	encrypted_tuples: Union[List[EncryptedTuple], EncryptedTable],
 	observations: Iterable[Tuple[Any, QueryObservation]],
 	x: Optional[int] = None,
 	rng_seed: int = 1234,
 ) -> float:
-	import random
-	rnd = random.Random(rng_seed)
-
-	# Bucket values by padded size
-	size_buckets = build_padded_size_buckets(value_counts, x)
-	remaining_values = {v: True for v in value_counts.keys()}
+	attacker = DatabaseRecoveryAttacker(value_counts, encrypted_tuples, x=x, rng_seed=rng_seed)
+	attacker.observe_all(observations)
+	return attacker.rate
 
-	# Group encrypted tuples by alpha_prefix (attacker can do this from IDs/prefixes)
-	by_prefix: Dict[int, List[EncryptedTuple]] = defaultdict(list)
-	for t in encrypted_tuples:
-		by_prefix[t.alpha_prefix].append(t)
+# Group encrypted tuples by alpha_prefix (attacker can do this from IDs/prefixes); a columnar table is already grouped
+def _prefix_pools(encrypted: Union[List[EncryptedTuple], EncryptedTable]) -> SwapRemovePools:
+	if isinstance(encrypted, EncryptedTable):
+		return SwapRemovePools.from_offsets(encrypted.value.tolist(), encrypted.offsets.tolist())
 
-	# We'll remove tuples from enc(T) as the attack assigns them
-	live_by_prefix: Dict[int, List[EncryptedTuple]] = {p: lst[:] for p, lst in by_prefix.items()}
-
-	correct = 0
-	denom = 0
-
-	for true_value, obs in observations:
-		# Step 1: guess the query plaintext value
-		candidates = [v for v in size_buckets.get(obs.observed_volume, []) if remaining_values.get(v, False)]
-		if not candidates:
-			guess = None
-		else:
-			guess = rnd.choice(candidates)
-			remaining_values[guess] = False
-
-		# Step 2: map returned tuples
-		for prefix in obs.returned_prefixes:
-			denom += 1
-			pool = live_by_prefix.get(prefix, [])
-			if not pool:
-				continue  # nothing left with that prefix; attacker can't map
-			chosen_idx = rnd.randrange(len(pool))
-			chosen = pool.pop(chosen_idx)  # remove from enc(T)
-
-			if guess is not None and chosen.value == guess:
-				correct += 1
-	return correct / denom if denom else 0.0
+	by_prefix: Dict[int, List[Any]] = defaultdict(list)
+	for t in encrypted:
+		by_prefix[t.alpha_prefix].append(t.value)
+	return SwapRemovePools.from_groups(by_prefix)
 	
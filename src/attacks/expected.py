@@ -0,0 +1,133 @@
+# src/attacks/expected.py
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.attacks.monte_carlo import MonteCarloResult, monte_carlo_attacks
+from src.attacks.query_recovery import build_padded_size_buckets
+from src.attacks.streams import iter_observations
+from src.attacks.types import EncryptedTable, EncryptedTuple, QueryObservation
+
+# Exact expected success of the uniform-guessing attackers, per query of the stream
+@dataclass(frozen=True)
+class ExpectedSuccess:
+	per_query_qrsr: np.ndarray        # P(query t guessed correctly)
+	per_query_hits: Optional[np.ndarray]   # expected correct tuple mappings in query t
+	per_query_draws: Optional[np.ndarray]  # returned tuples of query t (DRSR denominator share)
+	sampled: Optional[MonteCarloResult] = None
+
+	@property
+	def qrsr(self) -> float:
+		return float(self.per_query_qrsr.mean()) if self.per_query_qrsr.size else 0.0
+
+	@property
+	def drsr(self) -> Optional[float]:
+		if self.per_query_hits is None:
+			return None
+		denom = int(self.per_query_draws.sum())
+		return float(self.per_query_hits.sum() / denom) if denom else 0.0
+
+	# Expected (t, qrsr, drsr) after the first t queries, at every t or at the given checkpoints (clipped like evaluate_over_time)
+	def curve(self, points: Optional[List[int]] = None) -> List[Tuple[int, float, Optional[float]]]:
+		T = self.per_query_qrsr.size
+		ts = np.arange(1, T + 1)
+		q = np.cumsum(self.per_query_qrsr) / ts
+		if self.per_query_hits is not None:
+			draws = np.cumsum(self.per_query_draws)
+			d = np.divide(np.cumsum(self.per_query_hits), draws, out=np.zeros(T), where=draws > 0)
+		wanted = range(1, T + 1) if points is None else [min(t, T) for t in points if min(t, T) > 0]
+		return [(t, float(q[t - 1]), None if self.per_query_hits is None else float(d[t - 1])) for t in wanted]
+
+	# Sampled mean minus expectation, in standard errors of the sampled mean
+	def z_scores(self) -> Dict[str, float]:
+		if self.sampled is None:
+			raise ValueError("no sampled result, pass cross_check > 0")
+		out = {"qrsr": _z(self.sampled.qrsr, self.qrsr)}
+		if self.sampled.drsr is not None:
+			out["drsr"] = _z(self.sampled.drsr, self.drsr)
+		return out
+
+def _z(samples: np.ndarray, mean: float) -> float:
+	se = samples.std(ddof=1) / np.sqrt(samples.size) if samples.size > 1 else 0.0
+	diff = float(samples.mean() - mean)
+	return diff / se if se > 0 else (0.0 if abs(diff) < 1e-12 else float("inf"))
+
+# Closed form for query_recovery_attack / database_recovery_attack over distinct queries
+# Query t with padded volume b: the guess is the (c+1)-th item of a uniform permutation of bucket b, where c is the
+# number of earlier queries with volume b, so it is uniform over the bucket (size B) while c < B, else there is no guess:
+#   E[QRSR_t] = [true value in bucket b and c < B] / B
+# A tuple mapped from prefix pool p (L0_p tuples initially) is likewise a uniform item of that pool, independent of the
+# guess, and the draws per (query, prefix) are min(count, still-live) regardless of the rng, so with
+# S[b, p] = sum over values g in bucket b of N[g, p] (tuples of value g with prefix p):
+#   E[hits_t] = [c < B] / B * sum_p draws_{t,p} * S[b, p] / L0_p,   E[DRSR] = sum_t E[hits_t] / sum_t returned_t
+# cross_check > 0 also runs monte_carlo_attacks with that many replicates, see ExpectedSuccess.z_scores
+def expected_success(
+	value_counts: Dict[Any, int],
+	observations: Iterable[Tuple[Any, QueryObservation]],
+	encrypted_tuples: Optional[Union[List[EncryptedTuple], EncryptedTable]] = None,
+	x: Optional[int] = None,
+	cross_check: int = 0,
+	rng_seed: int = 1234,
+) -> ExpectedSuccess:
+	if cross_check > 0:
+		observations = list(iter_observations(observations))  # consumed twice
+
+	code_of = {v: i for i, v in enumerate(value_counts.keys())}
+	buckets = build_padded_size_buckets(value_counts, x)
+	bucket_ids = {vol: i for i, vol in enumerate(buckets.keys())}
+	bucket_size = np.array([len(vals) for vals in buckets.values()], dtype=np.int64)
+	bucket_of_code = np.empty(len(code_of), dtype=np.int64)
+	for vol, vals in buckets.items():
+		bucket_of_code[[code_of[v] for v in vals]] = bucket_ids[vol]
+
+	table = encrypted_tuples
+	if table is not None and not isinstance(table, EncryptedTable):
+		table = EncryptedTable.from_tuples(table, m=max((t.alpha_prefix for t in table), default=-1) + 1)
+	if table is not None:
+		m = table.m
+		codes = np.array([code_of.get(v, -1) for v in table.value.tolist()], dtype=np.int64)
+		known = codes >= 0
+		# S[b, p] via one bincount over (bucket, prefix) cells of the tuples with a known value
+		S = np.bincount(bucket_of_code[codes[known]] * m + table.alpha_prefix[known], minlength=bucket_size.size * m)
+		S = S.reshape(bucket_size.size, m).astype(float)
+		L0 = np.diff(table.offsets).astype(float)
+		frac = np.divide(S, L0, out=np.zeros_like(S), where=L0 > 0)  # S[b, p] / L0_p
+		live = np.diff(table.offsets).astype(np.int64)
+
+	seen = np.zeros(bucket_size.size, dtype=np.int64)
+	per_q: List[float] = []
+	hits: List[float] = []
+	draws: List[int] = []
+
+	for true_value, obs in iter_observations(observations):
+		b = bucket_ids.get(obs.observed_volume)
+		w = 0.0
+		if b is not None:
+			if seen[b] < bucket_size[b]:
+				w = 1.0 / bucket_size[b]
+			seen[b] += 1
+		code = code_of.get(true_value)
+		per_q.append(w if code is not None and bucket_of_code[code] == b else 0.0)
+
+		if table is None:
+			continue
+		prefixes, counts = obs.prefix_histogram()
+		draws.append(int(counts.sum()))
+		inside = prefixes < m
+		prefixes, counts = prefixes[inside], counts[inside]
+		k = np.minimum(counts, live[prefixes])
+		live[prefixes] -= k
+		hits.append(w * float(k @ frac[b, prefixes]) if w > 0 else 0.0)
+
+	sampled = None
+	if cross_check > 0:
+		sampled = monte_carlo_attacks(value_counts, observations, encrypted_tuples, x=x, replicates=cross_check, rng_seed=rng_seed)
+
+	return ExpectedSuccess(
+		per_query_qrsr=np.array(per_q, dtype=float),
+		per_query_hits=None if table is None else np.array(hits, dtype=float),
+		per_query_draws=None if table is None else np.array(draws, dtype=np.int64),
+		sampled=sampled,
+	)
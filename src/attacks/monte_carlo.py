@@ -0,0 +1,139 @@
+# src/attacks/monte_carlo.py
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.attacks.query_recovery import build_padded_size_buckets
+from src.attacks.streams import iter_observations
+from src.attacks.types import EncryptedTable, EncryptedTuple, QueryObservation
+
+# Per-seed success rates of R independent attacker runs over the same observations
+@dataclass(frozen=True)
+class MonteCarloResult:
+	qrsr: np.ndarray               # shape (R,)
+	drsr: Optional[np.ndarray]     # shape (R,), None when no enc(T) was given
+
+	@property
+	def replicates(self) -> int:
+		return int(self.qrsr.size)
+
+	def summary(self) -> Dict[str, float]:
+		out = {"qrsr_mean": float(self.qrsr.mean()), "qrsr_std": float(self.qrsr.std())}
+		if self.drsr is not None:
+			out.update(drsr_mean=float(self.drsr.mean()), drsr_std=float(self.drsr.std()))
+		return out
+
+# Batched version of query_recovery_attack + database_recovery_attack for R attacker seeds at once
+# Both attacks draw uniformly without replacement from keyed pools (padded-size buckets, alpha-prefix pools), and which
+# pool a draw comes from and how many draws each pool serves never depend on the rng; so the whole run of one attacker
+# is "take the next items of an independent random permutation of each pool", and the draw positions are fixed
+# up front. Per replicate we only permute the pools (Generator.permuted, row-wise) and compare with fancy indexing
+# Each replicate has the same distribution as one sequential attacker run; QRSR and DRSR of a replicate share its
+# step-1 guesses (the sequential functions use separate streams). Replicates are processed `block` at a time, which
+# bounds memory at about 3 * block * len(enc(T)) int32s; results depend on (rng_seed, replicates, block)
+def monte_carlo_attacks(
+	value_counts: Dict[Any, int],
+	observations: Iterable[Tuple[Any, QueryObservation]],
+	encrypted_tuples: Optional[Union[List[EncryptedTuple], EncryptedTable]] = None,
+	x: Optional[int] = None,
+	replicates: int = 100,
+	rng_seed: int = 1234,
+	block: int = 16,
+) -> MonteCarloResult:
+	if replicates <= 0 or block <= 0:
+		raise ValueError("replicates and block must be positive")
+
+	# Values as dense codes; -1 marks "no guess", -2 a true value / tuple value the attacker doesn't know
+	code_of = {v: i for i, v in enumerate(value_counts.keys())}
+
+	# Step-1 pools: buckets laid out back to back in one code array
+	bucket_start: Dict[int, int] = {}
+	bucket_size: Dict[int, int] = {}
+	bucket_codes: List[int] = []
+	for vol, vals in build_padded_size_buckets(value_counts, x).items():
+		bucket_start[vol] = len(bucket_codes)
+		bucket_size[vol] = len(vals)
+		bucket_codes.extend(code_of[v] for v in vals)
+	bucket_arr = np.array(bucket_codes, dtype=np.int32)
+
+	table = encrypted_tuples
+	if table is not None and not isinstance(table, EncryptedTable):
+		table = EncryptedTable.from_tuples(table, m=max((t.alpha_prefix for t in table), default=-1) + 1)
+	if table is not None:
+		pool_codes = np.array([code_of.get(v, -2) for v in table.value.tolist()], dtype=np.int32)
+		pool_off = table.offsets.tolist()
+		pool_used = [0] * table.m
+
+	# One pass over the observations: fixed positions of every draw
+	true_codes: List[int] = []
+	guess_pos: List[int] = []      # flat position in bucket_arr of query t's guess, -1 if bucket missing/exhausted
+	draw_pos: List[np.ndarray] = []  # flat positions in pool_codes of query t's mapped tuples
+	draw_query: List[np.ndarray] = []
+	bucket_used: Dict[int, int] = {}
+	denom = 0
+
+	for t, (true_value, obs) in enumerate(iter_observations(observations)):
+		true_codes.append(code_of.get(true_value, -2))
+		vol = obs.observed_volume
+		used = bucket_used.get(vol, 0)
+		if used < bucket_size.get(vol, 0):
+			guess_pos.append(bucket_start[vol] + used)
+			bucket_used[vol] = used + 1
+		else:
+			guess_pos.append(-1)
+
+		if table is None:
+			continue
+		prefixes, counts = obs.prefix_histogram()
+		denom += int(counts.sum())
+		for p, c in zip(prefixes.tolist(), counts.tolist()):
+			if p >= table.m:
+				continue
+			s = pool_off[p] + pool_used[p]
+			k = min(c, pool_off[p + 1] - s)
+			if k > 0:
+				draw_pos.append(np.arange(s, s + k, dtype=np.int64))
+				draw_query.append(np.full(k, t, dtype=np.int64))
+				pool_used[p] += k
+
+	T = len(true_codes)
+	qrsr = np.zeros(replicates, dtype=float)
+	drsr = None if table is None else np.zeros(replicates, dtype=float)
+	if T == 0:
+		return MonteCarloResult(qrsr=qrsr, drsr=drsr)
+
+	true_arr = np.array(true_codes, dtype=np.int32)
+	gpos = np.array(guess_pos, dtype=np.int64)
+	has_guess = gpos >= 0
+	if table is not None and draw_pos:
+		dpos = np.concatenate(draw_pos)
+		dquery = np.concatenate(draw_query)
+
+	rng = np.random.default_rng(rng_seed)
+	for r0 in range(0, replicates, block):
+		rb = min(block, replicates - r0)
+
+		# Step 1: guesses[r, t] = next item of replicate r's permutation of the query's bucket
+		perm = np.broadcast_to(bucket_arr, (rb, bucket_arr.size)).copy()
+		for vol, s in bucket_start.items():
+			e = s + bucket_size[vol]
+			perm[:, s:e] = rng.permuted(perm[:, s:e], axis=1)
+		guesses = np.full((rb, T), -1, dtype=np.int32)
+		guesses[:, has_guess] = perm[:, gpos[has_guess]]
+		qrsr[r0:r0 + rb] = (guesses == true_arr).sum(axis=1) / T
+
+		# Step 2: mapped tuples are the leading items of each prefix pool's permutation
+		if table is None or not draw_pos or denom == 0:
+			continue
+		pools = np.broadcast_to(pool_codes, (rb, pool_codes.size)).copy()
+		for p in range(table.m):
+			s, e = pool_off[p], pool_off[p + 1]
+			if e - s > 1:
+				pools[:, s:e] = rng.permuted(pools[:, s:e], axis=1)
+		g = guesses[:, dquery]
+		hits = (pools[:, dpos] == g) & (g >= 0)
+		drsr[r0:r0 + rb] = hits.sum(axis=1) / denom
+
+	return MonteCarloResult(qrsr=qrsr, drsr=drsr)
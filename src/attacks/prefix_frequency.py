@@ -0,0 +1,75 @@
+# src/attacks/prefix_frequency.py
+from __future__ import annotations
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from src.attacks.assignment import linear_sum_assignment
+from src.attacks.padding import next_power_of_x
+from src.attacks.query_recovery import build_padded_size_buckets
+from src.attacks.streams import iter_observations
+from src.attacks.types import EncryptedTable, EncryptedTuple, QueryObservation
+
+# Prefix co-occurrence frequency attack (strong model: attacker knows enc(T) values and alpha-prefixes)
+# Unlike query_recovery_attack, which guesses uniformly inside a padded-size bucket, this uses each observation's
+# prefix histogram: value v is expected to return N[v, p] real tuples with prefix p plus (padded(c_v) - c_v) dummies
+# spread uniformly over the m prefixes, E[v] = N[v] + (padded(c_v) - c_v) / m
+# Within each padded-size bucket, queries are matched one-to-one to distinct values by minimizing the total squared
+# L2 distance |O_t - E_v|^2 (|O_t|^2 dropped, it is constant per query), costs built with one matmul per bucket
+# and assigned with the Hungarian method; candidate values are shuffled (rng_seed) so ties, e.g. alpha = 0 where every
+# histogram is just the volume, resolve uniformly instead of in dataset order
+# Returns: QRSR (fraction of queries assigned their true value)
+def prefix_frequency_attack(
+	value_counts: Dict[Any, int],
+	encrypted_tuples: Union[List[EncryptedTuple], EncryptedTable],
+	observations: Iterable[Tuple[Any, QueryObservation]],
+	x: Optional[int] = None,
+	rng_seed: int = 1234,
+) -> float:
+	rng = np.random.default_rng(rng_seed)
+	table = encrypted_tuples
+	if not isinstance(table, EncryptedTable):
+		table = EncryptedTable.from_tuples(table, m=max((t.alpha_prefix for t in table), default=-1) + 1)
+	m = table.m
+
+	values = list(value_counts.keys())
+	code_of = {v: i for i, v in enumerate(values)}
+
+	# Per-value real prefix histograms N (V x m), then expected observed histograms E
+	codes = np.array([code_of.get(v, -1) for v in table.value.tolist()], dtype=np.int64)
+	known = codes >= 0
+	N = np.bincount(codes[known] * m + table.alpha_prefix[known], minlength=len(values) * m).reshape(len(values), m)
+	real = np.array([value_counts[v] for v in values], dtype=float)
+	padded = np.array([next_power_of_x(int(c), x) for c in real], dtype=float)
+	E = N + ((padded - real) / max(m, 1))[:, None]
+	E_sq = (E * E).sum(axis=1)
+
+	# Group observations by observed volume, keeping each query's histogram as a dense row
+	by_volume: Dict[int, List[int]] = defaultdict(list)
+	truths: List[Any] = []
+	rows: List[np.ndarray] = []
+	for t, (true_value, obs) in enumerate(iter_observations(observations)):
+		truths.append(true_value)
+		prefixes, counts = obs.prefix_histogram()
+		inside = prefixes < m
+		row = np.zeros(m)
+		row[prefixes[inside]] = counts[inside]
+		rows.append(row)
+		by_volume[obs.observed_volume].append(t)
+
+	correct = 0
+	for vol, vals in build_padded_size_buckets(value_counts, x).items():
+		qs = by_volume.get(vol)
+		if not qs:
+			continue
+		vals = [vals[i] for i in rng.permutation(len(vals))]
+		cols = np.array([code_of[v] for v in vals], dtype=np.int64)
+		O = np.stack([rows[t] for t in qs])
+		cost = E_sq[cols][None, :] - 2.0 * (O @ E[cols].T)
+		r, c = linear_sum_assignment(cost)
+		for qi, vi in zip(r.tolist(), c.tolist()):
+			if vals[vi] == truths[qs[qi]]:
+				correct += 1
+
+	return correct / len(truths) if truths else 0.0
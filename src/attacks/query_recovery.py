@@ -1,9 +1,12 @@
 # src/attacks/query_recovery.py
 from __future__ import annotations
+import random
 from collections import defaultdict
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from src.attacks.padding import next_power_of_x
+from src.attacks.sampling import SwapRemovePools
+from src.attacks.streams import iter_observations
 from src.attacks.types import QueryObservation
 
 # Attacker knows plaintext counts per value, compute padded sizes, then group values by padded size
@@ -14,8 +17,42 @@ def build_padded_size_buckets(value_counts: Dict[Any, int], x: Optional[int]) ->
 		buckets[ps].append(v)
 	return buckets
 
+# Live (not yet guessed) values of each padded-size bucket, guessing a value draws it out of its bucket in O(1)
+def build_live_size_buckets(value_counts: Dict[Any, int], x: Optional[int]) -> SwapRemovePools:
+	return SwapRemovePools.from_groups(build_padded_size_buckets(value_counts, x))
+
+# Resumable SEAL query recovery attacker: consumes observations one at a time and keeps its state (live buckets,
+# rng, running counts), so success after the first t queries is read off `rate` without re-running the attack
+# Guesses are drawn with swap-remove from per-bucket live pools: same single randrange per guess as the old
+# filter-then-choice loop, but the live order differs after the first removal, so seeds give a different (equally uniform) stream
+class QueryRecoveryAttacker:
+	def __init__(self, value_counts: Dict[Any, int], x: Optional[int] = None, rng_seed: int = 1234):
+		self._rnd = random.Random(rng_seed)
+		self._buckets = build_live_size_buckets(value_counts, x)  # attacker removes guesses from T
+		self.correct = 0
+		self.total = 0
+
+	# Guess the value behind one observation, returns the guess
+	# If padding creates collisions or candidates exhausted, attacker "fails gracefully" (guess is None)
+	def observe(self, true_value: Any, obs: QueryObservation) -> Optional[Any]:
+		self.total += 1
+		guess = self._buckets.draw(obs.observed_volume, self._rnd)
+		if guess == true_value:
+			self.correct += 1
+		return guess
+
+	def observe_all(self, observations: Iterable[Tuple[Any, QueryObservation]]) -> None:
+		for true_value, obs in iter_observations(observations):
+			self.observe(true_value, obs)
+
+	# QRSR so far (fraction of queries correctly guessed)
+	@property
+	def rate(self) -> float:
+		return self.correct / self.total if self.total else 0.0
+
 # Implements SEAL query recovery attack
-# Inputs: value_counts (plaintext counts per value, attacker knows dataset), observations (iterable of (true_value, QueryObservation)
+# Inputs: value_counts (plaintext counts per value, attacker knows dataset), observations (iterable of (true_value, QueryObservation),
+# or of lists of them, e.g. a chunked oracle stream; consumed lazily, one pass)
 # Returns: QRSR (fraction of queries correctly guessed)
 def query_recovery_attack(
 	value_counts: Dict[Any, int],
@@ -23,27 +60,6 @@ def query_recovery_attack(
 	x: Optional[int] = None,
 	rng_seed: int = 1234,
 ) -> float:
-	import random
-	rnd = random.Random(rng_seed)
-
-	buckets = build_padded_size_buckets(value_counts, x)
-	remaining = {v: True for v in value_counts.keys()}  # attacker removes guesses from T
-
-	correct = 0
-	total = 0
-
-	for true_value, obs in observations:
-		total += 1
-		candidates = [v for v in buckets.get(obs.observed_volume, []) if remaining.get(v, False)]
-
-		# If padding creates collisions or candidates exhausted, attacker "fails gracefully"
-		if not candidates:
-			guess = None
-		else:
-			guess = rnd.choice(candidates)
-			remaining[guess] = False  # remove chosen value from T
-
-		if guess == true_value:
-			correct += 1
-
-	return correct / total if total else 0.0
+	attacker = QueryRecoveryAttacker(value_counts, x=x, rng_seed=rng_seed)
+	attacker.observe_all(observations)
+	return attacker.rate
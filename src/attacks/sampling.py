@@ -0,0 +1,73 @@
+# src/attacks/sampling.py
+from __future__ import annotations
+import random
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence
+
+# Keyed pools of live items with O(1) uniform draw-and-remove
+# All pools share one flat list, pool k occupies items[start[k] : start[k] + live[k]]
+# Drawing picks a uniform live slot, returns its item, and moves the pool's last live item into that slot
+# (swap-remove), so pools are never copied or shifted, but the order of live items changes as items are drawn
+class SwapRemovePools:
+	def __init__(self, items: List[Any], start: Dict[Hashable, int], live: Dict[Hashable, int]):
+		self._items = items
+		self._start = start
+		self._live = live
+
+	# One pool per key, items copied in iteration order
+	@staticmethod
+	def from_groups(groups: Dict[Hashable, Iterable[Any]]) -> "SwapRemovePools":
+		items: List[Any] = []
+		start: Dict[Hashable, int] = {}
+		live: Dict[Hashable, int] = {}
+		for key, group in groups.items():
+			start[key] = len(items)
+			items.extend(group)
+			live[key] = len(items) - start[key]
+		return SwapRemovePools(items, start, live)
+
+	# Pools keyed 0..len(offsets)-2 over an already grouped flat list, pool k is items[offsets[k]:offsets[k+1]]
+	# `items` is used in place (not copied) and gets reordered by draws
+	@staticmethod
+	def from_offsets(items: List[Any], offsets: Sequence[int]) -> "SwapRemovePools":
+		bounds = list(offsets)
+		start = {k: bounds[k] for k in range(len(bounds) - 1)}
+		live = {k: bounds[k + 1] - bounds[k] for k in range(len(bounds) - 1)}
+		return SwapRemovePools(items, start, live)
+
+	def live(self, key: Hashable) -> int:
+		return self._live.get(key, 0)
+
+	def live_items(self, key: Hashable) -> List[Any]:
+		s = self._start.get(key, 0)
+		return self._items[s:s + self.live(key)]
+
+	# Uniformly draws and removes one live item of pool `key`, None if the pool is empty or unknown
+	# Consumes exactly one rnd.randrange(live) call per successful draw (none for an empty pool)
+	def draw(self, key: Hashable, rnd: random.Random) -> Optional[Any]:
+		n = self._live.get(key, 0)
+		if n == 0:
+			return None
+		s = self._start[key]
+		i = s + rnd.randrange(n)
+		last = s + n - 1
+		chosen = self._items[i]
+		self._items[i] = self._items[last]
+		self._items[last] = chosen
+		self._live[key] = n - 1
+		return chosen
+
+	# Draws and removes min(k, live) items of pool `key` at once, returned in no particular order
+	# Same rnd calls and the same pool state as that many draw() calls (a partial Fisher-Yates over the pool's tail)
+	def draw_many(self, key: Hashable, k: int, rnd: random.Random) -> List[Any]:
+		n = self._live.get(key, 0)
+		k = min(k, n)
+		if k <= 0:
+			return []
+		s = self._start[key]
+		items = self._items
+		randrange = rnd.randrange
+		for last in range(s + n - 1, s + n - 1 - k, -1):
+			i = s + randrange(last - s + 1)
+			items[i], items[last] = items[last], items[i]
+		self._live[key] = n - k
+		return items[s + n - k:s + n]
@@ -0,0 +1,28 @@
+# src/attacks/streams.py
+from __future__ import annotations
+from typing import Any, Iterable, Iterator, List, Tuple, Union
+
+from src.attacks.types import QueryObservation
+
+Observation = Tuple[Any, QueryObservation]
+
+# Attacks accept a stream of (true_value, QueryObservation) pairs or of chunks (lists of pairs), consumed lazily
+def iter_observations(stream: Iterable[Union[Observation, List[Observation]]]) -> Iterator[Observation]:
+	for item in stream:
+		if isinstance(item, list):
+			yield from item
+		else:
+			yield item
+
+# Groups a lazy observation stream into lists of up to `size` pairs
+def chunk_observations(stream: Iterable[Observation], size: int) -> Iterator[List[Observation]]:
+	if size <= 0:
+		raise ValueError("chunk_size must be positive")
+	chunk: List[Observation] = []
+	for item in stream:
+		chunk.append(item)
+		if len(chunk) == size:
+			yield chunk
+			chunk = []
+	if chunk:
+		yield chunk
@@ -1,6 +1,8 @@
 # src/attacks/types.py
-from dataclasses import dataclass
-from typing import Any, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 # What exists in the encrypted DB (conceptual); attacker does not see value, they see 'alpha_prefix' (oram_index)
 @dataclass(frozen=True)
@@ -9,12 +11,95 @@ class EncryptedTuple:
 	value: Any                 # plaintext attribute value (known to attacker in strong model)
 	alpha_prefix: int          # leaked identifier prefix (your oram_index)
 
+# Columnar enc(T): one row per encrypted tuple, rows sorted (stably) by alpha_prefix
+# Rows with prefix p are [offsets[p], offsets[p+1]); within a prefix, rows keep enc_id order
+@dataclass(frozen=True, eq=False)
+class EncryptedTable:
+	enc_id: np.ndarray
+	value: np.ndarray
+	alpha_prefix: np.ndarray
+	offsets: np.ndarray        # length m + 1
+
+	@staticmethod
+	def from_columns(enc_id: np.ndarray, value: np.ndarray, alpha_prefix: np.ndarray, m: int) -> "EncryptedTable":
+		alpha_prefix = np.asarray(alpha_prefix, dtype=np.int64)
+		order = np.argsort(alpha_prefix, kind="stable")
+		offsets = np.zeros(m + 1, dtype=np.int64)
+		np.cumsum(np.bincount(alpha_prefix, minlength=m), out=offsets[1:])
+		return EncryptedTable(
+			enc_id=np.asarray(enc_id)[order],
+			value=np.asarray(value)[order],
+			alpha_prefix=alpha_prefix[order],
+			offsets=offsets,
+		)
+
+	@staticmethod
+	def from_tuples(tuples: Sequence[EncryptedTuple], m: int) -> "EncryptedTable":
+		return EncryptedTable.from_columns(
+			enc_id=np.array([t.enc_id for t in tuples], dtype=np.int64),
+			value=np.array([t.value for t in tuples]),
+			alpha_prefix=np.array([t.alpha_prefix for t in tuples], dtype=np.int64),
+			m=m,
+		)
+
+	def __len__(self) -> int:
+		return int(self.enc_id.size)
+
+	@property
+	def m(self) -> int:
+		return int(self.offsets.size - 1)
+
+	def prefix_values(self, prefix: int) -> np.ndarray:
+		return self.value[self.offsets[prefix]:self.offsets[prefix + 1]]
+
+# Multiset of returned prefixes: distinct prefixes (ascending) and how many returned tuples carried each
+@dataclass(frozen=True, eq=False)
+class PrefixHistogram:
+	prefixes: np.ndarray
+	counts: np.ndarray
+
+	@staticmethod
+	def from_prefixes(prefixes: np.ndarray, m: int) -> "PrefixHistogram":
+		counts = np.bincount(np.asarray(prefixes, dtype=np.int64), minlength=m)
+		present = np.nonzero(counts)[0]
+		return PrefixHistogram(prefixes=present, counts=counts[present])
+
+	def __eq__(self, other: object) -> bool:
+		if not isinstance(other, PrefixHistogram):
+			return NotImplemented
+		return np.array_equal(self.prefixes, other.prefixes) and np.array_equal(self.counts, other.counts)
+
+	def total(self) -> int:
+		return int(self.counts.sum())
+
 # Per query, what the attacker sees: observed_volume: |Sq| (padded later), returned_prefixes: list of leaked alpha_prefix values for each returned encrypted tuple
+# Compact form: returned_prefixes is left empty and prefix_hist holds the same multiset (one entry per distinct prefix)
 @dataclass(frozen=True)
 class QueryObservation:
 	token_id: int              # opaque handle for the query token (attacker doesn't know plaintext value)
 	observed_volume: int
-	returned_prefixes: List[int]
+	returned_prefixes: List[int] = field(default_factory=list)
+	prefix_hist: Optional[PrefixHistogram] = None
+
+	@property
+	def is_compact(self) -> bool:
+		return self.prefix_hist is not None
+
+	# (distinct prefixes, counts) for either form
+	def prefix_histogram(self) -> Tuple[np.ndarray, np.ndarray]:
+		if self.prefix_hist is not None:
+			return self.prefix_hist.prefixes, self.prefix_hist.counts
+		prefixes, counts = np.unique(np.asarray(self.returned_prefixes, dtype=np.int64), return_counts=True)
+		return prefixes, counts
+
+	# Every returned prefix, once per returned tuple (list order, or grouped by prefix for the compact form)
+	def iter_prefixes(self) -> Iterator[int]:
+		if self.prefix_hist is None:
+			yield from self.returned_prefixes
+			return
+		for prefix, count in zip(self.prefix_hist.prefixes.tolist(), self.prefix_hist.counts.tolist()):
+			for _ in range(count):
+				yield prefix
 
 @dataclass(frozen=True)
 class AttackResult:
@@ -5,10 +5,13 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import numpy as np
 
-from src.seal.seal_client import SealClient
+from src.seal.router import SealRouter
 from src.workload.leakage_oracle import SealLeakageOracle
 from src.attacks.query_recovery import query_recovery_attack
 from src.attacks.database_recovery import database_recovery_attack
+from src.attacks.prefix_frequency import prefix_frequency_attack
+from src.attacks.monte_carlo import monte_carlo_attacks
+from src.attacks.expected import expected_success
 
 @dataclass(frozen=True)
 class PaddingEvalRow:
@@ -20,11 +23,21 @@ class PaddingEvalRow:
 	avg_real_vol: float
 	avg_padded_vol: float
 	overhead_factor: float    # avg_padded / avg_real
+	freq_qrsr: Optional[float] = None  # prefix-histogram frequency attack, when enabled
+	qrsr_mean: Optional[float] = None  # mean / std over Monte Carlo attacker seeds, when replicates > 0
+	qrsr_std: Optional[float] = None
+	drsr_mean: Optional[float] = None
+	drsr_std: Optional[float] = None
+	exp_qrsr: Optional[float] = None  # closed-form expectation over attacker seeds, when expected=True
+	exp_drsr: Optional[float] = None
 
 def _safe_mean(vals: List[int]) -> float:
 	return float(np.mean(vals)) if vals else 0.0
 
-# Runs attacks for each (alpha, x) and computes padding overhead
+# Runs attacks for each (alpha, x) and computes padding overhead; frequency_attack=True also runs the
+# prefix-histogram frequency attack (freq_qrsr); replicates > 0 adds the mean / std of QRSR and DRSR over that many
+# attacker seeds (monte_carlo_attacks), qrsr / drsr stay the single rng_seed run; expected=True adds their exact
+# expectation (expected_success)
 def evaluate_padding_sweep(
 	dataset_index: Dict[Any, np.ndarray],
 	value_counts: Dict[Any, int],
@@ -34,6 +47,10 @@ def evaluate_padding_sweep(
 	alphas: List[int],
 	xs: List[Optional[int]],
 	rng_seed: int = 0,
+	frequency_attack: bool = False,
+	prp_key: Optional[bytes] = None,
+	replicates: int = 0,
+	expected: bool = False,
 ) -> List[PaddingEvalRow]:
 	rows: List[PaddingEvalRow] = []
 
@@ -51,7 +68,7 @@ def evaluate_padding_sweep(
 
 	for x in xs:
 		for alpha in alphas:
-			seal = SealClient(n=n, Z=Z, alpha=alpha, default_value=0)
+			seal = SealRouter(n=n, alpha=alpha, prp_key=prp_key)
 			oracle = SealLeakageOracle(
 				seal=seal,
 				dataset_index=dataset_index,
@@ -60,10 +77,15 @@ def evaluate_padding_sweep(
 			)
 
 			obs = oracle.observe_query_stream(distinct_q)
-			encT = oracle.build_encrypted_tuples()
+			encT = oracle.build_encrypted_table()
 
 			qrsr = query_recovery_attack(value_counts, obs, x=x, rng_seed=rng_seed)
 			drsr = database_recovery_attack(value_counts, encT, obs, x=x, rng_seed=rng_seed)
+			freq = prefix_frequency_attack(value_counts, encT, obs, x=x, rng_seed=rng_seed) if frequency_attack else None
+			spread = {}
+			if replicates > 0:
+				spread = monte_carlo_attacks(value_counts, obs, encT, x=x, replicates=replicates, rng_seed=rng_seed).summary()
+			exp = expected_success(value_counts, obs, encT, x=x) if expected else None
 
 			padded_vols = [o.observed_volume for _, o in obs]
 			avg_pad = _safe_mean(padded_vols)
@@ -79,6 +101,10 @@ def evaluate_padding_sweep(
 					avg_real_vol=avg_real,
 					avg_padded_vol=avg_pad,
 					overhead_factor=overhead,
+					freq_qrsr=freq,
+					**spread,
+					exp_qrsr=None if exp is None else exp.qrsr,
+					exp_drsr=None if exp is None else exp.drsr,
 				)
 			)
 	return rows
@@ -3,9 +3,11 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
 
+import os
 import time
 import random
 
+from src.eval.io_utils import write_csv
 from src.path_oram.client import PathOramClient
 from src.seal.seal_client import SealClient
 
@@ -26,6 +28,7 @@ class PerfConfig:
 	hot_fraction: float = 0.10
 	hot_mass: float = 0.90
 	working_set_fraction: float = 0.01
+	prp_key: Optional[bytes] = None  # SEAL routing key, None = fresh random key per run
 
 @dataclass(frozen=True)
 class PerfRow:
@@ -37,6 +40,7 @@ class PerfRow:
 	avg_bandwidth_bytes: float
 	avg_buckets_read: float
 	avg_buckets_written: float
+	total_bandwidth_bytes: int  # whole trace, avg_bandwidth_bytes * num_ops
 
 def _make_block_trace(cfg: PerfConfig) -> List[int]:
 	rng = random.Random(cfg.seed)
@@ -103,15 +107,22 @@ def run_perf_path_oram(cfg: PerfConfig) -> PerfRow:
 		avg_bandwidth_bytes=total_bytes / cfg.num_ops,
 		avg_buckets_read=total_br / cfg.num_ops,
 		avg_buckets_written=total_bw / cfg.num_ops,
+		total_bandwidth_bytes=total_bytes,
 	)
 
-def run_perf_seal(cfg: PerfConfig, alpha: int) -> PerfRow:
+# If telemetry_dir is given, per-sub-ORAM telemetry is written to telemetry_dir/seal_telemetry_<pattern>_alpha<alpha>.csv
+def run_perf_seal(cfg: PerfConfig, alpha: int, telemetry_dir: Optional[str] = None) -> PerfRow:
 	rng = random.Random(cfg.seed + 2 + alpha)
 
-	seal = SealClient(n=cfg.n, Z=cfg.Z, alpha=alpha, default_value=0, block_size_bytes=cfg.block_size_bytes)
+	seal = SealClient(n=cfg.n, Z=cfg.Z, alpha=alpha, default_value=0, block_size_bytes=cfg.block_size_bytes, prp_key=cfg.prp_key)
 	trace = _make_block_trace(cfg)
 
-	total_br = total_bw = total_bytes = 0
+	# Sub-ORAMs are lazy; build the ones this trace touches up front so setup stays out of the timed loop
+	seal.materialize({seal.route(bid)[0] for bid in trace})
+
+	# Bytes and access counts come from the client's running totals, diffed around the timed loop
+	total_br = total_bw = 0
+	accesses0, bytes0 = seal.total_accesses, seal.total_bandwidth_bytes
 	t0 = time.perf_counter()
 
 	for bid in trace:
@@ -126,9 +137,16 @@ def run_perf_seal(cfg: PerfConfig, alpha: int) -> PerfRow:
 		log = seal.last_access
 		total_br += log.buckets_read
 		total_bw += log.buckets_written
-		total_bytes += log.approx_bandwidth_bytes
 
 	t1 = time.perf_counter()
+	accesses = seal.total_accesses - accesses0
+	total_bytes = seal.total_bandwidth_bytes - bytes0
+
+	if telemetry_dir is not None:
+		tel = seal.telemetry
+		imbalance = {"imbalance_cv": tel.imbalance(), "max_over_mean": tel.max_over_mean()}
+		rows = [{"pattern": cfg.pattern, "alpha": alpha, **r, **imbalance} for r in tel.rows()]
+		write_csv(os.path.join(telemetry_dir, f"seal_telemetry_{cfg.pattern}_alpha{alpha}.csv"), rows)
 
 	return PerfRow(
 		scheme="seal",
@@ -136,7 +154,8 @@ def run_perf_seal(cfg: PerfConfig, alpha: int) -> PerfRow:
 		pattern=cfg.pattern,
 		num_ops=cfg.num_ops,
 		seconds=(t1 - t0),
-		avg_bandwidth_bytes=total_bytes / cfg.num_ops,
-		avg_buckets_read=total_br / cfg.num_ops,
-		avg_buckets_written=total_bw / cfg.num_ops,
+		avg_bandwidth_bytes=total_bytes / accesses,
+		avg_buckets_read=total_br / accesses,
+		avg_buckets_written=total_bw / accesses,
+		total_bandwidth_bytes=total_bytes,
 	)
@@ -1,11 +1,12 @@
 # src/eval/phase3_runner.pyfrom __future__ import annotations
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple
 
-from src.seal.seal_client import SealClient
+from src.seal.router import SealRouter
 from src.workload.leakage_oracle import SealLeakageOracle
-from src.attacks.query_recovery import query_recovery_attack
-from src.attacks.database_recovery import database_recovery_attack
+from src.attacks.query_recovery import QueryRecoveryAttacker
+from src.attacks.database_recovery import DatabaseRecoveryAttacker
+from src.attacks.expected import expected_success
 from src.eval.checkpoints import CheckpointSpec, DEFAULT_CHECKPOINTS
 
 @dataclass(frozen=True)
@@ -16,13 +17,20 @@ class RunConfig:
 	padding_x: Optional[int] = None
 	rng_seed: int = 0
 	checkpoints: CheckpointSpec = DEFAULT_CHECKPOINTS
+	every_t: bool = False  # record (t, qrsr, drsr) after every query instead of only at checkpoints
+	prp_key: Optional[bytes] = None  # None = fresh random routing key per alpha
+	expected: bool = False  # also compute the closed-form expected (t, qrsr, drsr) at the same points
 
 @dataclass(frozen=True)
 class TimeSeriesResult:
 	# keyed by alpha -> list of (t, qrsr, drsr)
 	series: Dict[int, List[Tuple[int, float, float]]]
+	# same shape, expectation over attacker seeds (expected_success), only filled when cfg.expected
+	expected: Dict[int, List[Tuple[int, float, float]]] = field(default_factory=dict)
 
-# For each alpha: build SEAL client, build leakage oracle, generate leakage stream for query_values_in_order, and at each checkpoint t run attacks on prefix observations[:t]
+# For each alpha: build SEAL router (routing only, no ORAM trees), build leakage oracle, and stream the leakage for
+# query_values_in_order through resumable attackers once; the attack state after t queries is exactly what a fresh
+# run on observations[:t] with the same seed would reach, so each checkpoint just reads the running rates
 def evaluate_over_time(
 	dataset_index: Dict[Any, Any],
 	value_counts: Dict[Any, int],
@@ -30,6 +38,7 @@ def evaluate_over_time(
 	cfg: RunConfig,
 ) -> TimeSeriesResult:
 	series: Dict[int, List[Tuple[int, float, float]]] = {}
+	expected: Dict[int, List[Tuple[int, float, float]]] = {}
 
 	# We want *distinct* query values for paper attacks
 	# If caller accidentally includes repeats, we de-dup in order.
@@ -40,27 +49,37 @@ def evaluate_over_time(
 			seen.add(v)
 			distinct_in_order.append(v)
 
+	total = len(distinct_in_order)
+	wanted = {min(t, total) for t in cfg.checkpoints.points if min(t, total) > 0}
+
 	for alpha in cfg.alphas:
-		seal = SealClient(n=cfg.n, Z=cfg.Z, alpha=alpha, default_value=0)
+		seal = SealRouter(n=cfg.n, alpha=alpha, prp_key=cfg.prp_key)
 		oracle = SealLeakageOracle(seal=seal, dataset_index=dataset_index, padding_x=cfg.padding_x, rng_seed=cfg.rng_seed)
 
-		# Precompute encrypted tuples once per alpha (used in DRSR)
-		encT = oracle.build_encrypted_tuples()
-
-		# Build the stream of leakage observations for this workload
-		observations = oracle.observe_query_stream(distinct_in_order)
+		# Precompute the columnar enc(T) once per alpha (used in DRSR)
+		encT = oracle.build_encrypted_table()
 
-		out: List[Tuple[int, float, float]] = []
-		for t in cfg.checkpoints.points:
-			t_eff = min(t, len(observations))
-			if t_eff <= 0:
-				continue
+		qra = QueryRecoveryAttacker(value_counts, x=cfg.padding_x, rng_seed=cfg.rng_seed)
+		dra = DatabaseRecoveryAttacker(value_counts, encT, x=cfg.padding_x, rng_seed=cfg.rng_seed)
 
-			prefix_obs = observations[:t_eff]
-			qrsr = query_recovery_attack(value_counts, prefix_obs, x=cfg.padding_x, rng_seed=cfg.rng_seed)
-			drsr = database_recovery_attack(value_counts, encT, prefix_obs, x=cfg.padding_x, rng_seed=cfg.rng_seed)
+		# Single pass over the lazy leakage stream for this workload
+		at: Dict[int, Tuple[int, float, float]] = {}
+		dense: List[Tuple[int, float, float]] = []
+		for t, (true_value, obs) in enumerate(oracle.iter_query_stream(distinct_in_order), start=1):
+			qra.observe(true_value, obs)
+			dra.observe(true_value, obs)
+			if cfg.every_t:
+				dense.append((t, qra.rate, dra.rate))
+			elif t in wanted:
+				at[t] = (t, qra.rate, dra.rate)
 
-			out.append((t_eff, qrsr, drsr))
+		if cfg.every_t:
+			series[alpha] = dense
+		else:
+			series[alpha] = [at[min(t, total)] for t in cfg.checkpoints.points if min(t, total) > 0]
 
-		series[alpha] = out
-	return TimeSeriesResult(series=series)
+		# Second pass over the (deterministic) stream for the expected curve
+		if cfg.expected:
+			exp = expected_success(value_counts, oracle.iter_query_stream(distinct_in_order), encT, x=cfg.padding_x)
+			expected[alpha] = exp.curve(None if cfg.every_t else cfg.checkpoints.points)
+	return TimeSeriesResult(series=series, expected=expected)
@@ -6,7 +6,7 @@ from typing import Any, Dict, List, Optional
 import matplotlib.pyplot as plt
 
 from src.workload.synthetic import make_zipf_dataset
-from src.seal.seal_client import SealClient
+from src.seal.router import SealRouter
 from src.workload.leakage_oracle import SealLeakageOracle
 from src.workload.path_oram_oracle import PathOramLeakageOracle
 
@@ -113,10 +113,10 @@ def main():
 		baseline_stats_by_L[L] = bstats
 
 		for alpha in cfg.alphas:
-			seal = SealClient(n=cfg.n, Z=cfg.Z, alpha=alpha, default_value=0)
+			seal = SealRouter(n=cfg.n, alpha=alpha)
 			oracle = SealLeakageOracle(seal=seal, dataset_index=ds.index, padding_x=cfg.padding_x, rng_seed=cfg.seed)
 			
-			encT = oracle.build_encrypted_tuples()
+			encT = oracle.build_encrypted_table()
 
 			stats = evaluate_sessions(
 				oracle=oracle,
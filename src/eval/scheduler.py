@@ -0,0 +1,329 @@
+# src/eval/scheduler.py
+from __future__ import annotations
+import hashlib
+import json
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.eval.perf_runner import PerfConfig, run_perf_path_oram, run_perf_seal
+from src.eval.workloads import WorkloadSpec, make_uniform_distinct, make_zipf_like_distinct, make_hot_set_distinct
+from src.eval.phase3_runner import RunConfig, evaluate_over_time
+from src.eval.checkpoints import CheckpointSpec
+from src.eval.padding_eval import evaluate_padding_sweep
+from src.eval.sessions import SessionPlan, sample_sessions
+from src.eval.session_eval import evaluate_sessions
+from src.seal.router import SealRouter
+from src.workload.leakage_oracle import SealLeakageOracle
+from src.workload.path_oram_oracle import PathOramLeakageOracle
+from src.workload.synthetic import SyntheticDataset, make_zipf_dataset
+
+# Stage fields that only list which cells exist; a cell's own value is in its key
+_EXPANSION_FIELDS = ("alphas", "patterns", "xs", "session_lengths")
+
+# One independent unit of a master_runner config: a stage plus the (pattern / x / L, alpha) it covers
+# key examples: ("uniform", "path_oram"), ("uniform", 3), (None, 2) for padding x=None alpha=2, (50, "baseline")
+@dataclass(frozen=True)
+class Cell:
+	stage: str
+	key: Tuple[Any, Any]
+
+# Expands the enabled stages of a config into cells, in the order master_runner assembles their outputs
+def expand_cells(cfg: Dict[str, Any]) -> List[Cell]:
+	toggles = cfg["toggles"]
+	cells: List[Cell] = []
+	if toggles.get("perf", True):
+		pc = cfg["perf"]
+		for pattern in pc["patterns"]:
+			cells.append(Cell("perf", (pattern, "path_oram")))
+			cells.extend(Cell("perf", (pattern, a)) for a in pc["alphas"])
+	if toggles.get("over_time", True):
+		ot = cfg["over_time"]
+		cells.extend(Cell("over_time", (pattern, a)) for pattern in ot["patterns"] for a in ot["alphas"])
+	if toggles.get("padding_sweep", True):
+		ps = cfg["padding_sweep"]
+		cells.extend(Cell("padding_sweep", (x, a)) for x in padding_xs(ps) for a in ps["alphas"])
+	if toggles.get("sessions", True):
+		sc = cfg["sessions"]
+		for L in sc["session_lengths"]:
+			cells.append(Cell("sessions", (L, "baseline")))
+			cells.extend(Cell("sessions", (L, a)) for a in sc["alphas"])
+	return cells
+
+def padding_xs(ps: Dict[str, Any]) -> List[Optional[int]]:
+	return [None if x in ("None", None) else int(x) for x in ps["xs"]]
+
+# Deterministic per-cell PRP key, derived from the dataset seed, the stage's seed and the cell key, so a cell routes
+# the same way whether it runs serially, in any worker, or in a later run
+def cell_prp_key(cfg: Dict[str, Any], cell: Cell) -> bytes:
+	material = json.dumps([cfg["dataset"]["seed"], cfg[cell.stage]["seed"], cell.stage, list(cell.key)])
+	return hashlib.sha256(material.encode("utf-8")).digest()[:16]
+
+# Source each stage's cells run, relative to src/ (a directory means every .py file under it); scheduler.py holds
+# run_cell itself. Plotting, replot scripts and master_runner only assemble finished results, so they stay out
+_COMMON_CODE = ("eval/scheduler.py", "eval/workloads.py", "workload/synthetic.py")
+_ORAM_CODE = ("path_oram", "seal")
+_ATTACK_CODE = ("attacks", "workload/leakage_oracle.py", "workload/path_oram_oracle.py")
+STAGE_CODE: Dict[str, Tuple[str, ...]] = {
+	"perf": _COMMON_CODE + ("eval/perf_runner.py", "eval/io_utils.py") + _ORAM_CODE,
+	"over_time": _COMMON_CODE + ("eval/phase3_runner.py", "eval/checkpoints.py") + _ATTACK_CODE + _ORAM_CODE,
+	"padding_sweep": _COMMON_CODE + ("eval/padding_eval.py",) + _ATTACK_CODE + _ORAM_CODE,
+	"sessions": _COMMON_CODE + ("eval/session_eval.py", "eval/sessions.py") + _ATTACK_CODE + _ORAM_CODE,
+}
+
+_SRC_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_CODE_VERSION: Dict[str, str] = {}
+
+def _stage_files(stage: str, root: str) -> List[str]:
+	files = set()
+	for rel in STAGE_CODE[stage]:
+		path = os.path.join(root, rel)
+		if not os.path.isdir(path):
+			files.add(path)
+			continue
+		for dirpath, dirnames, filenames in os.walk(path):
+			dirnames[:] = [d for d in dirnames if d != "__pycache__"]
+			files.update(os.path.join(dirpath, name) for name in filenames if name.endswith(".py"))
+	return sorted(files)
+
+# Hash of the source files a stage depends on, so cached cells are invalidated only by changes to code they run
+# (root is for tests; the default src/ tree is hashed once per process)
+def code_version(stage: str, root: Optional[str] = None) -> str:
+	if root is None and stage in _CODE_VERSION:
+		return _CODE_VERSION[stage]
+	base = root or _SRC_ROOT
+	h = hashlib.sha256()
+	for path in _stage_files(stage, base):
+		h.update(os.path.relpath(path, base).replace(os.sep, "/").encode("utf-8"))
+		with open(path, "rb") as f:
+			h.update(f.read())
+	if root is None:
+		_CODE_VERSION[stage] = h.hexdigest()
+	return h.hexdigest()
+
+# Content address of a cell: everything its result depends on (the dataset config also seeds the PRP key, so it
+# is part of perf cells too); adding an alpha or pattern to a stage leaves the other cells' hashes unchanged
+def cell_hash(cfg: Dict[str, Any], cell: Cell) -> str:
+	effective = {
+		"stage": cell.stage,
+		"key": list(cell.key),
+		"params": {k: v for k, v in cfg[cell.stage].items() if k not in _EXPANSION_FIELDS},
+		"dataset": cfg["dataset"],
+		"code": code_version(cell.stage),
+	}
+	return hashlib.sha256(json.dumps(effective, sort_keys=True).encode("utf-8")).hexdigest()
+
+# Finished cells persisted as cache_dir/<stage>/<cell_hash>.pkl; writes go through a temp file + rename so a
+# killed run never leaves a truncated entry
+class ResultCache:
+	def __init__(self, cache_dir: str):
+		self.cache_dir = cache_dir
+
+	def _path(self, cfg: Dict[str, Any], cell: Cell) -> str:
+		return os.path.join(self.cache_dir, cell.stage, cell_hash(cfg, cell) + ".pkl")
+
+	def get(self, cfg: Dict[str, Any], cell: Cell) -> Tuple[bool, Any]:
+		path = self._path(cfg, cell)
+		if not os.path.exists(path):
+			return False, None
+		with open(path, "rb") as f:
+			return True, pickle.load(f)
+
+	def put(self, cfg: Dict[str, Any], cell: Cell, result: Any) -> None:
+		path = self._path(cfg, cell)
+		os.makedirs(os.path.dirname(path), exist_ok=True)
+		tmp = path + ".tmp"
+		with open(tmp, "wb") as f:
+			pickle.dump(result, f)
+		os.replace(tmp, path)
+
+# Datasets are rebuilt (deterministically) once per process, not shipped to workers
+_DATASETS: Dict[Tuple[Any, ...], SyntheticDataset] = {}
+
+def load_dataset(ds_cfg: Dict[str, Any]) -> SyntheticDataset:
+	key = (ds_cfg["n"], ds_cfg["vocab"], ds_cfg["zipf_a"], ds_cfg["seed"])
+	if key not in _DATASETS:
+		_DATASETS[key] = make_zipf_dataset(n=ds_cfg["n"], vocab=ds_cfg["vocab"], a=ds_cfg["zipf_a"], seed=ds_cfg["seed"])
+	return _DATASETS[key]
+
+def make_queries(pattern: str, all_values: List[Any], counts: Dict[Any, int], num_queries: int, seed: int, pattern_params: Dict[str, Any]):
+	spec = WorkloadSpec(
+		name=pattern,
+		num_queries=num_queries,
+		seed=seed,
+		hot_fraction=pattern_params.get("hot_fraction", 0.10),
+		hot_mass=pattern_params.get("hot_mass", 0.90),
+		working_set_fraction=pattern_params.get("working_set_fraction", 0.01),
+	)
+	if pattern == "uniform":
+		return make_uniform_distinct(all_values, spec)
+	if pattern == "zipf_like":
+		return make_zipf_like_distinct(all_values, counts, spec)
+	if pattern == "hot_set":
+		return make_hot_set_distinct(all_values, counts, spec)
+	raise ValueError("unknown pattern")
+
+# Runs one cell and returns its picklable result:
+# perf -> PerfRow dict, over_time -> {"series": [(t, qrsr, drsr)], "expected": same or None}, padding_sweep -> PaddingEvalRow, sessions -> row dict
+def run_cell(cfg: Dict[str, Any], cell: Cell, out_root: str) -> Any:
+	prp_key = cell_prp_key(cfg, cell)
+	if cell.stage == "perf":
+		return _run_perf_cell(cfg, cell, out_root, prp_key)
+
+	ds_cfg = cfg["dataset"]
+	ds = load_dataset(ds_cfg)
+	counts = ds.value_counts()
+	all_values = list(ds.index.keys())
+
+	if cell.stage == "over_time":
+		ot = cfg["over_time"]
+		pattern, alpha = cell.key
+		qvals = make_queries(pattern, all_values, counts, num_queries=ot["num_queries"], seed=ot["seed"], pattern_params=ot)
+		rc = RunConfig(
+			n=ds_cfg["n"],
+			Z=ot["Z"],
+			alphas=[alpha],
+			padding_x=ot.get("padding_x", None),
+			rng_seed=ot["seed"],
+			checkpoints=CheckpointSpec(points=ot["checkpoints"]),
+			every_t=ot.get("every_t", False),
+			prp_key=prp_key,
+			expected=ot.get("expected", False),
+		)
+		ts = evaluate_over_time(ds.index, counts, qvals, rc)
+		return {"series": ts.series[alpha], "expected": ts.expected.get(alpha)}
+
+	if cell.stage == "padding_sweep":
+		ps = cfg["padding_sweep"]
+		x, alpha = cell.key
+		qvals = make_queries(ps["pattern"], all_values, counts, num_queries=ps["num_queries"], seed=ps["seed"], pattern_params=ps)
+		rows = evaluate_padding_sweep(
+			dataset_index=ds.index,
+			value_counts=counts,
+			query_values_in_order=qvals,
+			n=ds_cfg["n"],
+			Z=ps["Z"],
+			alphas=[alpha],
+			xs=[x],
+			rng_seed=ps["seed"],
+			frequency_attack=ps.get("frequency_attack", False),
+			replicates=ps.get("replicates", 0),
+			expected=ps.get("expected", False),
+			prp_key=prp_key,
+		)
+		return rows[0]
+
+	if cell.stage == "sessions":
+		return _run_session_cell(cfg, cell, ds, prp_key)
+
+	raise ValueError(f"unknown stage {cell.stage!r}")
+
+def _run_perf_cell(cfg: Dict[str, Any], cell: Cell, out_root: str, prp_key: bytes) -> Dict[str, Any]:
+	perf_cfg = cfg["perf"]
+	pattern, alpha = cell.key
+	pc = PerfConfig(
+		n=perf_cfg["n"],
+		Z=perf_cfg["Z"],
+		alphas=perf_cfg["alphas"],
+		num_ops=perf_cfg["num_ops"],
+		read_fraction=perf_cfg["read_fraction"],
+		block_size_bytes=perf_cfg["block_size_bytes"],
+		seed=perf_cfg["seed"],
+		pattern=pattern,
+		hot_fraction=perf_cfg.get("hot_fraction", 0.10),
+		hot_mass=perf_cfg.get("hot_mass", 0.90),
+		working_set_fraction=perf_cfg.get("working_set_fraction", 0.01),
+		prp_key=prp_key,
+	)
+	if alpha == "path_oram":
+		return asdict(run_perf_path_oram(pc))
+	return asdict(run_perf_seal(pc, alpha=alpha, telemetry_dir=os.path.join(out_root, "results")))
+
+def _run_session_cell(cfg: Dict[str, Any], cell: Cell, ds: SyntheticDataset, prp_key: bytes) -> Dict[str, Any]:
+	sc = cfg["sessions"]
+	L, alpha = cell.key
+	padding_x = sc.get("padding_x", None)
+	counts = ds.value_counts()
+
+	plan = SessionPlan(
+		num_sessions=sc["num_sessions"],
+		session_length=L,
+		pattern=sc["pattern"],
+		seed=sc["seed"],
+		hot_fraction=sc.get("hot_fraction", 0.10),
+		hot_mass=sc.get("hot_mass", 0.90),
+		working_set_fraction=sc.get("working_set_fraction", 0.01),
+	)
+	sessions = sample_sessions(list(ds.index.keys()), counts, plan)
+
+	if alpha == "baseline":
+		oracle = PathOramLeakageOracle(dataset_index=ds.index, constant_volume=1, padding_x=padding_x)
+		stats = evaluate_sessions(oracle=oracle, value_counts=counts, encrypted_tuples=None, sessions=sessions,
+			padding_x=padding_x, base_seed=sc["seed"])
+		return {"scheme": "path_oram_baseline", "alpha": 0, "L": L, **asdict(stats)}
+
+	seal = SealRouter(n=cfg["dataset"]["n"], alpha=alpha, prp_key=prp_key)
+	oracle = SealLeakageOracle(seal=seal, dataset_index=ds.index, padding_x=padding_x, rng_seed=sc["seed"])
+	stats = evaluate_sessions(oracle=oracle, value_counts=counts, encrypted_tuples=oracle.build_encrypted_table(),
+		sessions=sessions, padding_x=padding_x, base_seed=sc["seed"])
+	return {"scheme": "seal", "alpha": alpha, "L": L, **asdict(stats)}
+
+# Runs cells serially in this process (workers <= 1) or on a process pool (workers = 0 means one per CPU)
+# Results are keyed by cell, so they are identical however the cells were scheduled (perf `seconds` aside,
+# which are wall-clock timings and pick up contention when perf cells share cores)
+# With a cache, cells already stored are loaded instead of run, and each cell is stored as soon as it finishes
+# Progress is reported per finished cell, in completion order
+# On a pool, a failing cell doesn't abandon the others: every future is drained (successes still cached) and the
+# first error is raised afterwards
+# (a cached perf cell doesn't rewrite its telemetry CSV, which the run that computed it left in out_root)
+def run_cells(
+	cfg: Dict[str, Any],
+	cells: List[Cell],
+	out_root: str,
+	workers: int = 1,
+	cache: Optional[ResultCache] = None,
+) -> Dict[Cell, Any]:
+	results: Dict[Cell, Any] = {}
+	todo: List[Cell] = []
+	for cell in cells:
+		hit, res = cache.get(cfg, cell) if cache is not None else (False, None)
+		if hit:
+			results[cell] = res
+		else:
+			todo.append(cell)
+	if cache is not None:
+		print(f"Cells: {len(cells) - len(todo)} cached, {len(todo)} to run")
+
+	finished = 0
+
+	def done(cell: Cell, res: Any) -> None:
+		nonlocal finished
+		results[cell] = res
+		if cache is not None:
+			cache.put(cfg, cell, res)
+		finished += 1
+		print(f"[{finished}/{len(todo)}] {cell.stage} {cell.key} done")
+
+	if workers == 0:
+		workers = os.cpu_count() or 1
+	if workers <= 1 or len(todo) <= 1:
+		for cell in todo:
+			done(cell, run_cell(cfg, cell, out_root))
+	else:
+		with ProcessPoolExecutor(max_workers=min(workers, len(todo))) as pool:
+			futures = {pool.submit(run_cell, cfg, cell, out_root): cell for cell in todo}
+			error: Optional[BaseException] = None
+			for fut in as_completed(futures):
+				try:
+					res = fut.result()
+				except Exception as e:
+					if error is None:
+						error = e
+					continue
+				done(futures[fut], res)
+		if error is not None:
+			raise error
+
+	return {cell: results[cell] for cell in cells}
@@ -7,6 +7,7 @@ import numpy as np
 
 from src.attacks.query_recovery import query_recovery_attack
 from src.attacks.database_recovery import database_recovery_attack
+from src.attacks.types import EncryptedTable
 from src.workload.leakage_oracle import SealLeakageOracle
 from src.workload.path_oram_oracle import PathOramLeakageOracle
 
@@ -27,7 +28,7 @@ def _mean_std(xs: List[float]) -> Tuple[float, float]:
 def evaluate_sessions(
 	oracle: Union[SealLeakageOracle, PathOramLeakageOracle],
 	value_counts: Dict[Any, int],
-	encrypted_tuples: Optional[list] ,
+	encrypted_tuples: Optional[Union[list, EncryptedTable]],
 	sessions: List[List[Any]],
 	padding_x: Optional[int],
 	base_seed: int = 0,
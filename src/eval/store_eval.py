@@ -0,0 +1,60 @@
+# src/eval/store_eval.py
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+import numpy as np
+
+from src.seal.seal_client import SealClient
+from src.workload.seal_store import SealRecordStore
+from src.workload.synthetic import SyntheticDataset
+
+@dataclass(frozen=True)
+class StoreCostRow:
+	alpha: int
+	x: Optional[int]          # None = no padding
+	num_queries: int
+	load_seconds: float
+	avg_real_vol: float
+	avg_padded_vol: float
+	avg_query_seconds: float
+	p95_query_seconds: float
+	avg_query_bytes: float
+
+# Measures the real ORAM cost of each (alpha, x) point: load the dataset into a SEAL store, then time the query workload
+def evaluate_store_costs(
+	ds: SyntheticDataset,
+	query_values_in_order: List[Any],
+	Z: int,
+	alphas: List[int],
+	xs: List[Optional[int]],
+	block_size_bytes: int = 64,
+	rng_seed: int = 0,
+) -> List[StoreCostRow]:
+	rows: List[StoreCostRow] = []
+
+	for alpha in alphas:
+		# Loading dominates; reuse one loaded store for every padding level of this alpha
+		seal = SealClient(n=ds.n, Z=Z, alpha=alpha, default_value=0, block_size_bytes=block_size_bytes)
+		store = SealRecordStore(seal, rng_seed=rng_seed)
+		load_seconds, _ = store.load(ds)
+
+		for x in xs:
+			store.padding_x = x
+			results = [store.query(v) for v in query_values_in_order]
+			secs = np.array([r.seconds for r in results], dtype=float)
+
+			rows.append(
+				StoreCostRow(
+					alpha=alpha,
+					x=x,
+					num_queries=len(results),
+					load_seconds=load_seconds,
+					avg_real_vol=float(np.mean([r.real_volume for r in results])) if results else 0.0,
+					avg_padded_vol=float(np.mean([r.padded_volume for r in results])) if results else 0.0,
+					avg_query_seconds=float(secs.mean()) if results else 0.0,
+					p95_query_seconds=float(np.percentile(secs, 95)) if results else 0.0,
+					avg_query_bytes=float(np.mean([r.bandwidth_bytes for r in results])) if results else 0.0,
+				)
+			)
+	return rows
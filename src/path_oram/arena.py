@@ -0,0 +1,136 @@
+# src/path_oram/arena.py
+from __future__ import annotations
+from typing import Any, List, Optional
+
+import numpy as np
+
+from .server import ServerStats
+from .types import Block, Bucket
+from .utils import path_nodes
+
+# Column layout of one arena slot (one block position inside a bucket)
+COL_REAL = 0      # 1 if the slot holds a real block, 0 for a dummy
+COL_ID = 1
+COL_LEAF = 2
+COL_DATA = 3      # payload; arena storage requires integer block data (see check_arena_payload)
+NUM_COLS = 4
+
+_INT64_MIN = -(1 << 63)
+_INT64_MAX = (1 << 63) - 1
+
+# Payloads live in the int64 DATA column: floats would be truncated silently and None / bytes / str would fail deep
+# inside eviction, so clients check default values and written data up front
+def check_arena_payload(value: Any, what: str = "block data") -> None:
+	if isinstance(value, (bool, np.bool_)) or not isinstance(value, (int, np.integer)):
+		raise ValueError(f"arena storage requires int64 {what}, got {type(value).__name__} {value!r}")
+	if not (_INT64_MIN <= int(value) <= _INT64_MAX):
+		raise ValueError(f"arena storage requires int64 {what}, {value!r} is out of range")
+
+# Heap-order bucket offset of (level, idx) inside one tree
+def _bucket_offset(level: int, idx: int) -> int:
+	return (1 << level) - 1 + idx
+
+# One contiguous int64 array holding many bucket trees back to back (e.g. every SEAL sub-ORAM)
+# Tree t owns buckets [base[t], base[t] + 2^(depth_t+1) - 1), each bucket is Z consecutive slots
+# All-zero rows are dummies, so a fresh (or memory-mapped) arena is an empty set of trees with no per-bucket setup
+class TreeArena:
+	def __init__(self, depths: List[int], Z: int, path: Optional[str] = None):
+		self.depths = list(depths)
+		self.Z = Z
+		self.path = path
+
+		self.base: List[int] = []
+		total_buckets = 0
+		for depth in self.depths:
+			self.base.append(total_buckets)
+			total_buckets += (1 << (depth + 1)) - 1
+		self.total_buckets = total_buckets
+
+		shape = (total_buckets * Z, NUM_COLS)
+		if path is None:
+			self.slots = np.zeros(shape, dtype=np.int64)
+		else:
+			self.slots = np.memmap(path, dtype=np.int64, mode="w+", shape=shape)
+
+	@property
+	def num_trees(self) -> int:
+		return len(self.depths)
+
+	@property
+	def nbytes(self) -> int:
+		return int(self.slots.nbytes)
+
+	def tree(self, tree_index: int) -> "ArenaServerTree":
+		if not (0 <= tree_index < self.num_trees):
+			raise ValueError("tree_index out of range")
+		return ArenaServerTree(self, tree_index)
+
+	# Copy of every partition at once (for checkpoints / comparisons)
+	def snapshot(self) -> np.ndarray:
+		return np.array(self.slots, copy=True)
+
+	def flush(self) -> None:
+		if isinstance(self.slots, np.memmap):
+			self.slots.flush()
+
+# ServerTree-compatible view of one tree inside a TreeArena, with its own ServerStats
+class ArenaServerTree:
+	def __init__(self, arena: TreeArena, tree_index: int, dummy_filler: Any = None):
+		self.arena = arena
+		self.tree_index = tree_index
+		self.depth = arena.depths[tree_index]
+		self.Z = arena.Z
+		self.dummy_filler = dummy_filler
+		self.stats = ServerStats()
+
+	def _path_rows(self, leaf: int) -> np.ndarray:
+		base = self.arena.base[self.tree_index]
+		buckets = np.array([base + _bucket_offset(level, idx) for (level, idx) in path_nodes(leaf, self.depth)], dtype=np.int64)
+		return (buckets[:, None] * self.Z + np.arange(self.Z, dtype=np.int64)).ravel()
+
+	def _decode_bucket(self, rows: np.ndarray, leaf_hint: int) -> Bucket:
+		bucket = Bucket(Z=self.Z)
+		for real, block_id, leaf, data in rows.tolist():
+			if real:
+				bucket.blocks.append(Block(block_id=block_id, data=data, leaf=leaf, is_dummy=False))
+		bucket.fill_with_dummies(leaf_hint=leaf_hint, filler=self.dummy_filler)
+		return bucket
+
+	# Same contract as ServerTree.read_path: returns root->leaf buckets and clears them on the server
+	def read_path(self, leaf: int) -> list[Bucket]:
+		rows = self._path_rows(leaf)
+		data = self.arena.slots[rows]
+		self.arena.slots[rows] = 0
+		self.stats.buckets_read += self.depth + 1
+
+		return [self._decode_bucket(data[i * self.Z:(i + 1) * self.Z], leaf) for i in range(self.depth + 1)]
+
+	def write_path(self, leaf: int, buckets: list[Bucket]) -> None:
+		if len(buckets) != self.depth + 1:
+			raise ValueError("write_path: buckets length mismatch with path length")
+
+		out = np.zeros((len(buckets) * self.Z, NUM_COLS), dtype=np.int64)
+		for i, bucket in enumerate(buckets):
+			bucket.enforce_capacity()
+			self.stats.buckets_written += 1
+			row = i * self.Z
+			for b in bucket.blocks:
+				if not b.is_dummy:
+					out[row] = (1, b.block_id, b.leaf, int(b.data))
+					row += 1
+
+		self.arena.slots[self._path_rows(leaf)] = out
+
+	def reset_stats(self) -> None:
+		self.stats = ServerStats()
+
+	# Decoded tree[level][idx] view, matching ServerTree.tree (debugging / invariants only, O(tree size))
+	@property
+	def tree(self) -> list[list[Bucket]]:
+		base = self.arena.base[self.tree_index]
+		levels: list[list[Bucket]] = []
+		for level in range(self.depth + 1):
+			start = (base + _bucket_offset(level, 0)) * self.Z
+			rows = self.arena.slots[start:start + (1 << level) * self.Z]
+			levels.append([self._decode_bucket(rows[i * self.Z:(i + 1) * self.Z], 0) for i in range(1 << level)])
+		return levels
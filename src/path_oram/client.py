@@ -1,10 +1,12 @@
 # src/path_oram/client.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
+from .metrics import OramMetrics, estimate_bandwidth_bytes
 from .types import Block, Bucket
 from .server import ServerTree
+from .arena import ArenaServerTree, check_arena_payload
 from .utils import random_leaf, path_nodes, node_on_path_to_leaf, tree_depth_from_n
 
 @dataclass
@@ -14,6 +16,27 @@ class ClientConfig:
 	depth: int
 	default_value: Any = 0
 
+# Position map that draws a block's leaf on first lookup instead of up front
+# A never-accessed block isn't in the tree yet, so a fresh random leaf is indistinguishable from one drawn at setup
+class LazyPositionMap:
+	def __init__(self, n: int, depth: int):
+		self.n = n
+		self.depth = depth
+		self._leaves: dict[int, int] = {}
+
+	def __len__(self) -> int:
+		return self.n
+
+	def __getitem__(self, block_id: int) -> int:
+		leaf = self._leaves.get(block_id)
+		if leaf is None:
+			leaf = random_leaf(self.depth)
+			self._leaves[block_id] = leaf
+		return leaf
+
+	def __setitem__(self, block_id: int, leaf: int) -> None:
+		self._leaves[block_id] = leaf
+
 # Client owns: position map, stash (both secret)
 # Server owns: bucket tree (dumb storage)
 class PathOramClient:
@@ -24,12 +47,29 @@ class PathOramClient:
 		self.stash: list[Block] = []
 	
 	@classmethod
-	def setup(cls, n: int, Z: int, default_value: Any = 0) -> "PathOramClient":
+	def setup(
+		cls,
+		n: int,
+		Z: int,
+		default_value: Any = 0,
+		lazy_positions: bool = False,
+		server: Optional[ServerTree] = None,
+	) -> "PathOramClient":
 		depth = tree_depth_from_n(n)
-		server = ServerTree(depth=depth, Z=Z, dummy_filler=None)
+		# Caller may supply storage (e.g. an ArenaServerTree view); it must already have the right shape
+		if server is None:
+			server = ServerTree(depth=depth, Z=Z, dummy_filler=None)
+		elif server.depth != depth or server.Z != Z:
+			raise ValueError("setup: supplied server does not match (depth, Z)")
+		if isinstance(server, ArenaServerTree):
+			check_arena_payload(default_value, "default_value")
 		cfg = ClientConfig(n=n, Z=Z, depth=depth, default_value=default_value)
 		client = cls(server=server, cfg=cfg)
 
+		if lazy_positions:
+			client.position_map = LazyPositionMap(n=n, depth=depth)
+			return client
+
 		for i in range(n):
 			client.position_map[i] = random_leaf(depth)
 
@@ -37,11 +77,45 @@ class PathOramClient:
 
 	# Always reads/writes full path, uses stash + eviction
 	def access(self, op: str, block_id: int, new_data: Any = None) -> Optional[Any]:
+		self._check_op(op, block_id, new_data)
+		return self._access(op, block_id, new_data)
+
+	# Batch of (op, block_id[, new_data]) requests, validated up front then executed in order (one full path each)
+	# If `metrics` is given, one OramMetrics per access is appended to it
+	def access_many(
+		self,
+		ops: Sequence[tuple],
+		metrics: Optional[list[OramMetrics]] = None,
+		block_size_bytes: int = 64,
+	) -> list[Optional[Any]]:
+		for req in ops:
+			self._check_op(req[0], req[1], req[2] if len(req) > 2 else None)
+
+		results: list[Optional[Any]] = []
+		for req in ops:
+			stats = self.server.stats
+			br0, bw0 = stats.buckets_read, stats.buckets_written
+			results.append(self._access(req[0], req[1], req[2] if len(req) > 2 else None))
+
+			if metrics is not None:
+				br, bw = stats.buckets_read - br0, stats.buckets_written - bw0
+				metrics.append(OramMetrics(
+					buckets_read=br,
+					buckets_written=bw,
+					stash_size=len(self.stash),
+					approx_bandwidth_bytes=estimate_bandwidth_bytes(br, bw, self.cfg.Z, block_size_bytes),
+				))
+		return results
+
+	def _check_op(self, op: str, block_id: int, new_data: Any = None) -> None:
 		if not (0 <= block_id < self.cfg.n):
 			raise ValueError("block_id out of range")
 		if op not in ("read", "write"):
 			raise ValueError("op must be 'read' or 'write'")
+		if op == "write" and isinstance(self.server, ArenaServerTree):
+			check_arena_payload(new_data)
 
+	def _access(self, op: str, block_id: int, new_data: Any) -> Optional[Any]:
 		# 1) old leaf from pos map
 		old_leaf = self.position_map[block_id]
 
@@ -0,0 +1,138 @@
+# src/seal/access_log.py
+from __future__ import annotations
+import copy
+import os
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+# Column order matches the SealAccessLog fields
+LOG_COLUMNS = ("oram_index", "local_id", "buckets_read", "buckets_written", "stash_size", "approx_bandwidth_bytes", "migration")
+
+# Fixed-capacity columnar access log (one int64 array per SealAccessLog field)
+# Without spill_dir it is a ring buffer keeping the newest `capacity` accesses
+# With spill_dir every full chunk is written to spill_dir/access_log_XXXXXX.npz and the buffer starts over;
+# chunk numbers only grow (clear() deletes this log's chunk files but never reuses a number), and the summaries
+# cover every entry since the last clear(): spilled chunks are folded into running per-ORAM totals when written
+class AccessLogRing:
+	def __init__(self, capacity: int, num_orams: int, spill_dir: Optional[str] = None):
+		if capacity <= 0:
+			raise ValueError("capacity must be positive")
+		self.capacity = capacity
+		self.num_orams = num_orams
+		self.spill_dir = spill_dir
+		if spill_dir is not None:
+			os.makedirs(spill_dir, exist_ok=True)
+
+		self._cols: Dict[str, np.ndarray] = {c: np.zeros(capacity, dtype=np.int64) for c in LOG_COLUMNS}
+		self._next = 0          # slot the next entry is written to
+		self._size = 0          # entries currently held
+		self.total = 0          # entries ever appended
+		self.spilled_chunks: List[str] = []
+		self._chunk_seq = 0     # next chunk file number, never reset
+		self._spilled = _empty_totals(num_orams)
+
+	def __len__(self) -> int:
+		return self._size
+
+	# Accepts a SealAccessLog (or anything with the same attributes)
+	def append(self, entry: Any) -> None:
+		i = self._next
+		for c in LOG_COLUMNS:
+			self._cols[c][i] = getattr(entry, c)
+
+		self._next = (i + 1) % self.capacity
+		self._size = min(self._size + 1, self.capacity)
+		self.total += 1
+
+		if self._size == self.capacity and self.spill_dir is not None:
+			self._spill()
+
+	def _spill(self) -> None:
+		path = os.path.join(self.spill_dir, f"access_log_{self._chunk_seq:06d}.npz")
+		cols = self.columns()
+		np.savez(path, **cols)
+		_add_totals(self._spilled, cols, self.num_orams)
+		self._chunk_seq += 1
+		self.spilled_chunks.append(path)
+		self._next = 0
+		self._size = 0
+
+	# Drops every entry, including this log's spilled chunk files
+	def clear(self) -> None:
+		for path in self.spilled_chunks:
+			if os.path.exists(path):
+				os.remove(path)
+		self._next = 0
+		self._size = 0
+		self.total = 0
+		self.spilled_chunks = []
+		self._spilled = _empty_totals(self.num_orams)
+
+	# Retained entries as arrays, oldest first
+	def columns(self) -> Dict[str, np.ndarray]:
+		if self._size < self.capacity:
+			return {c: col[:self._size].copy() for c, col in self._cols.items()}
+		order = np.roll(np.arange(self.capacity), -self._next)
+		return {c: col[order] for c, col in self._cols.items()}
+
+	def column(self, name: str) -> np.ndarray:
+		return self.columns()[name]
+
+	# Spilled chunks followed by the in-memory tail
+	def iter_chunks(self) -> Iterator[Dict[str, np.ndarray]]:
+		for path in self.spilled_chunks:
+			with np.load(path) as chunk:
+				yield {c: chunk[c] for c in LOG_COLUMNS}
+		if self._size:
+			yield self.columns()
+
+	# ---------- vectorized summaries (retained entries: the ring, or with spilling everything since clear()) ----------
+
+	# Running totals of the spilled chunks plus the in-memory buffer
+	def _totals(self) -> Dict[str, Any]:
+		totals = copy.deepcopy(self._spilled)
+		_add_totals(totals, self.columns(), self.num_orams)
+		return totals
+
+	def means(self) -> Dict[str, float]:
+		t = self._totals()
+		return {c: t["sums"][c] / t["count"] if t["count"] else 0.0 for c in LOG_COLUMNS if c not in ("oram_index", "local_id")}
+
+	# Bytes moved by migration accesses vs application accesses
+	def migration_bytes(self) -> Dict[str, int]:
+		t = self._totals()
+		return {"migration": int(t["migration_bytes"]), "foreground": int(t["sums"]["approx_bandwidth_bytes"] - t["migration_bytes"])}
+
+	# Number of accesses per sub-ORAM
+	def per_oram_counts(self) -> np.ndarray:
+		return self._totals()["oram_counts"]
+
+	# Sum of a column per sub-ORAM (e.g. bytes moved per partition)
+	def per_oram_sum(self, name: str) -> np.ndarray:
+		return self._totals()["oram_sums"][name]
+
+	# Exact percentiles; with spilling this reads the one column back from every chunk
+	def percentiles(self, name: str, qs=(50, 90, 99)) -> Dict[float, float]:
+		col = np.concatenate([chunk[name] for chunk in self.iter_chunks()]) if self.spilled_chunks else self.column(name)
+		if col.size == 0:
+			return {q: 0.0 for q in qs}
+		return dict(zip(qs, np.percentile(col, qs).tolist()))
+
+def _empty_totals(num_orams: int) -> Dict[str, Any]:
+	return {
+		"count": 0,
+		"sums": {c: 0 for c in LOG_COLUMNS},
+		"migration_bytes": 0,
+		"oram_counts": np.zeros(num_orams, dtype=np.int64),
+		"oram_sums": {c: np.zeros(num_orams, dtype=float) for c in LOG_COLUMNS},
+	}
+
+def _add_totals(totals: Dict[str, Any], cols: Dict[str, np.ndarray], num_orams: int) -> None:
+	idx = cols["oram_index"]
+	totals["count"] += int(idx.size)
+	for c in LOG_COLUMNS:
+		totals["sums"][c] += int(cols[c].sum())
+		totals["oram_sums"][c] = totals["oram_sums"][c] + np.bincount(idx, weights=cols[c], minlength=num_orams)
+	totals["migration_bytes"] += int(cols["approx_bandwidth_bytes"][cols["migration"].astype(bool)].sum())
+	totals["oram_counts"] = totals["oram_counts"] + np.bincount(idx, minlength=num_orams)
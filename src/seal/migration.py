@@ -0,0 +1,187 @@
+# src/seal/migration.py
+from __future__ import annotations
+from typing import Any, Optional
+
+import os
+import secrets
+
+import numpy as np
+
+from src.seal.seal_client import SealClient
+
+# One bit per block (n/8 bytes), tracks which blocks already live in the new layout
+class MigrationBitmap:
+	def __init__(self, n: int):
+		self.n = n
+		self.bits = np.zeros((n + 7) // 8, dtype=np.uint8)
+		self.count = 0
+
+	def __getitem__(self, i: int) -> bool:
+		return bool(self.bits[i >> 3] & (1 << (i & 7)))
+
+	def set(self, i: int) -> None:
+		if not self[i]:
+			self.bits[i >> 3] |= np.uint8(1 << (i & 7))
+			self.count += 1
+
+	# First unset index >= start (n if none)
+	# The byte holding start is checked with bit ops first, O(1) in the common case (the cursor moved past one block);
+	# otherwise full bytes are skipped in windows doubling from 64 bytes, so a search stays close to the answer
+	def next_clear(self, start: int) -> int:
+		if start >= self.n:
+			return self.n
+		byte = start >> 3
+		b = int(self.bits[byte]) | ((1 << (start & 7)) - 1)  # bits below start count as set
+		window = 64
+		while b == 0xFF:
+			byte += 1
+			chunk = self.bits[byte:byte + window]
+			free = np.flatnonzero(chunk != 0xFF)
+			if free.size:
+				byte += int(free[0])
+				b = int(chunk[free[0]])
+			elif byte + window >= self.bits.size:
+				return self.n
+			else:
+				byte += window - 1
+				window *= 2
+		return min((byte << 3) + (~b & (b + 1)).bit_length() - 1, self.n)
+
+	@property
+	def nbytes(self) -> int:
+		return int(self.bits.nbytes)
+
+# Online move of every block from one SEAL layout (old client) to another (new client) without downtime
+# Foreground access() goes to whichever layout currently owns the block; after each one, `rate` blocks
+# (fractional rates accumulate) are moved in the background, in global-id order, by reading from old and writing to new
+# With migrate_on_access, a foreground access to a block still in the old layout moves it first (lazy migration)
+# Migration reads/writes are tagged migration=True in both clients' access logs and summed in migration_bytes
+class SealMigration:
+	def __init__(self, old: SealClient, new: SealClient, rate: float = 1.0, migrate_on_access: bool = False):
+		if old.params.n != new.params.n:
+			raise ValueError("old and new layouts must hold the same number of blocks")
+		if rate < 0:
+			raise ValueError("rate must be >= 0")
+		self.old = old
+		self.new = new
+		self.rate = rate
+		self.migrate_on_access = migrate_on_access
+
+		self.migrated = MigrationBitmap(old.params.n)
+		self.cursor = 0         # next global id the background sweep looks at
+		self.migration_bytes = 0
+		self._credit = 0.0
+
+	@property
+	def num_migrated(self) -> int:
+		return self.migrated.count
+
+	@property
+	def done(self) -> bool:
+		return self.num_migrated == self.old.params.n
+
+	@property
+	def progress(self) -> float:
+		return self.num_migrated / self.old.params.n
+
+	# Layout that currently holds global_id
+	def owner(self, global_id: int) -> SealClient:
+		return self.new if self.migrated[global_id] else self.old
+
+	def access(self, op: str, global_id: int, new_data: Any = None) -> Optional[Any]:
+		if self.migrate_on_access and not self.migrated[global_id]:
+			self._move(global_id)
+		result = self.owner(global_id).access(op, global_id, new_data)
+
+		self._credit += self.rate
+		steps = int(self._credit)
+		self._credit -= steps
+		if steps:
+			self.step(steps)
+		return result
+
+	def _move(self, global_id: int) -> None:
+		before = self.old.total_bandwidth_bytes + self.new.total_bandwidth_bytes
+		data = self.old.access("read", global_id, migration=True)
+		self.new.access("write", global_id, data, migration=True)
+		self.migration_bytes += self.old.total_bandwidth_bytes + self.new.total_bandwidth_bytes - before
+		self.migrated.set(global_id)
+
+	# Background sweep: moves up to max_blocks not-yet-migrated blocks, returns how many moved
+	def step(self, max_blocks: int = 1) -> int:
+		moved = 0
+		n = self.old.params.n
+		while moved < max_blocks:
+			self.cursor = self.migrated.next_clear(self.cursor)
+			if self.cursor >= n:
+				break
+			self._move(self.cursor)
+			moved += 1
+		return moved
+
+	# Drains the remaining blocks and returns the new layout (the old client can then be dropped)
+	def finish(self) -> SealClient:
+		self.step(self.old.params.n)
+		return self.new
+
+# The new layout keeps the old one's storage setup: arena-backed stays arena-backed (memory-mapped at arena_path if
+# given; the old file can't be reused while it still holds the old trees) and a spilling log keeps spilling, into
+# log_spill_dir or by default a per-layout subdirectory of the old spill dir (chunk names would collide otherwise)
+def _new_layout(
+	seal: SealClient,
+	alpha: int,
+	prp_key: bytes,
+	arena_path: Optional[str] = None,
+	log_spill_dir: Optional[str] = None,
+) -> SealClient:
+	if arena_path is not None and seal.arena is None:
+		raise ValueError("arena_path given but the client doesn't use arena storage")
+	if arena_path is not None and seal.arena.path is not None and os.path.abspath(arena_path) == os.path.abspath(seal.arena.path):
+		raise ValueError("arena_path must differ from the old layout's arena file")
+	if log_spill_dir is None and seal.log_spill_dir is not None:
+		log_spill_dir = os.path.join(seal.log_spill_dir, f"layout_alpha{alpha}_{prp_key.hex()[:8]}")
+	if log_spill_dir is not None and seal.log_spill_dir is not None and os.path.abspath(log_spill_dir) == os.path.abspath(seal.log_spill_dir):
+		raise ValueError("log_spill_dir must differ from the old layout's spill dir")
+	return SealClient(
+		n=seal.params.n,
+		Z=seal.Z,
+		alpha=alpha,
+		block_size_bytes=seal.block_size_bytes,
+		prp_key=prp_key,
+		prp=seal.router.prp_kind,
+		default_value=seal.default_value,
+		lazy=seal.lazy,
+		arena=seal.arena is not None,
+		arena_path=arena_path,
+		log_capacity=seal.log_capacity,
+		log_spill_dir=log_spill_dir,
+	)
+
+# Starts moving `seal` to a new alpha; the new layout keeps the same PRP (key and kind) unless prp_key is given
+def repartition(
+	seal: SealClient,
+	new_alpha: int,
+	rate: float = 1.0,
+	prp_key: Optional[bytes] = None,
+	migrate_on_access: bool = False,
+	arena_path: Optional[str] = None,
+	log_spill_dir: Optional[str] = None,
+) -> SealMigration:
+	new = _new_layout(seal, new_alpha, seal.router.prp_key if prp_key is None else prp_key, arena_path, log_spill_dir)
+	return SealMigration(seal, new, rate=rate, migrate_on_access=migrate_on_access)
+
+# Starts rotating the PRP key: blocks are re-routed to their new (sub-ORAM, local id) lazily on access and by background sweeps
+def rotate_key(
+	seal: SealClient,
+	new_key: Optional[bytes] = None,
+	rate: float = 1.0,
+	migrate_on_access: bool = True,
+	arena_path: Optional[str] = None,
+	log_spill_dir: Optional[str] = None,
+) -> SealMigration:
+	if new_key is None:
+		new_key = secrets.token_bytes(16)
+	if new_key == seal.router.prp_key:
+		raise ValueError("new_key must differ from the current key")
+	new = _new_layout(seal, seal.params.alpha, new_key, arena_path, log_spill_dir)
+	return SealMigration(seal, new, rate=rate, migrate_on_access=migrate_on_access)
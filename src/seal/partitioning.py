@@ -1,26 +1,92 @@
 # src/seal/partitioning.py
 from dataclasses import dataclass
 
+from src.path_oram.utils import tree_depth_from_n
+
 def is_power_of_two(x: int) -> bool:
 	return x > 0 and (x & (x - 1)) == 0
 
 @dataclass(frozen=True)
 class SealParams:
-	n: int         	# total logical blocks, must be power of two
+	n: int         	# total logical blocks (any n; power of two is the classic SEAL setting)
 	alpha: int      # leakage parameter
 	m: int          # number of sub-ORAMs = 2^alpha
-	k: int          # log2(n)
-	local_k: int    # k - alpha
-	local_n: int    # n / m
+	k: int          # PRP bit width, ceil(log2(n))
+	local_k: int    # bits of a local id, ceil(log2(local_n)) (= k - alpha for n = 2^k)
+	local_n: int    # capacity of each sub-ORAM, ceil(n / m) (= n / m for n = 2^k)
+
+	# Number of blocks in sub-ORAM i; every sub-ORAM is full except possibly the last one
+	def local_size(self, oram_index: int) -> int:
+		return min(self.local_n, self.n - oram_index * self.local_n)
+
+	@property
+	def is_power_of_two(self) -> bool:
+		return is_power_of_two(self.n)
 
-# SEAL expects n = 2^k, then m = 2^alpha sub-ORAMs, each local_n = 2^(k-alpha).
+# Classic SEAL uses n = 2^k, m = 2^alpha sub-ORAMs, each local_n = 2^(k-alpha)
+# For other n, the PRP permutes [0, n) (cycle walking inside k = ceil(log2 n) bits) and permuted id j goes to
+# sub-ORAM j // local_n, slot j % local_n; with local_n = ceil(n / m) only the last sub-ORAM is short
 def make_seal_params(n: int, alpha: int) -> SealParams:
-	if not is_power_of_two(n):
-		raise ValueError("SEAL requires n to be a power of two (e.g., 2^20).")
-	k = n.bit_length() - 1
+	if n < 1:
+		raise ValueError("SEAL requires n >= 1.")
+	k = (n - 1).bit_length()
 	if not (0 <= alpha <= k):
-		raise ValueError(f"alpha must be in [0, {k}] for n=2^{k}.")
+		raise ValueError(f"alpha must be in [0, {k}] for n={n}.")
 	m = 1 << alpha
-	local_k = k - alpha
-	local_n = 1 << local_k
+	local_n = -(-n // m)
+	if (m - 1) * local_n >= n:
+		raise ValueError(f"alpha={alpha} leaves an empty sub-ORAM for n={n}; use a smaller alpha.")
+	local_k = (local_n - 1).bit_length()
 	return SealParams(n=n, alpha=alpha, m=m, k=k, local_k=local_k, local_n=local_n)
+
+@dataclass(frozen=True)
+class SealFootprint:
+	n: int
+	alpha: int
+	server_buckets: int           # buckets across all sub-ORAM trees
+	storage_bytes: int            # server_buckets * Z * block_size_bytes
+	position_map_entries: int     # one per logical block
+	avg_access_buckets: float     # buckets read (= written) per access, for uniformly random block ids
+	avg_access_bytes: float       # read + write bytes per access
+
+# Server storage and per-access bandwidth of a SEAL layout (trees sized by tree_depth_from_n, as PathOramClient.setup does)
+def seal_footprint(params: SealParams, Z: int, block_size_bytes: int) -> SealFootprint:
+	buckets = 0
+	path_weighted = 0
+	for i in range(params.m):
+		size = params.local_size(i)
+		depth = tree_depth_from_n(size)
+		buckets += (1 << (depth + 1)) - 1
+		path_weighted += size * (depth + 1)
+
+	avg_path = path_weighted / params.n
+	return SealFootprint(
+		n=params.n,
+		alpha=params.alpha,
+		server_buckets=buckets,
+		storage_bytes=buckets * Z * block_size_bytes,
+		position_map_entries=params.n,
+		avg_access_buckets=avg_path,
+		avg_access_bytes=2 * avg_path * Z * block_size_bytes,
+	)
+
+@dataclass(frozen=True)
+class Pow2Comparison:
+	exact: SealFootprint           # SEAL over exactly n blocks
+	padded: SealFootprint          # baseline: n padded up to the next power of two
+	storage_ratio: float           # exact / padded
+	access_bytes_ratio: float
+	position_map_ratio: float
+
+# Overhead of running SEAL on exactly n blocks vs padding n to the next power of two (the old requirement)
+def compare_to_pow2_baseline(n: int, alpha: int, Z: int = 4, block_size_bytes: int = 64) -> Pow2Comparison:
+	exact = seal_footprint(make_seal_params(n, alpha), Z, block_size_bytes)
+	padded_n = 1 << (n - 1).bit_length()
+	padded = seal_footprint(make_seal_params(padded_n, alpha), Z, block_size_bytes)
+	return Pow2Comparison(
+		exact=exact,
+		padded=padded,
+		storage_ratio=exact.storage_bytes / padded.storage_bytes,
+		access_bytes_ratio=exact.avg_access_bytes / padded.avg_access_bytes,
+		position_map_ratio=exact.position_map_entries / padded.position_map_entries,
+	)
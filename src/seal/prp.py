@@ -1,6 +1,9 @@
 # src/seal/prp.py
 import hashlib
 from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
 
 def _hash_to_int(key: bytes, label: bytes, out_bytes: int = 8) -> int:
 	h = hashlib.blake2s(digest_size=out_bytes)
@@ -21,17 +24,57 @@ def _modinv(a: int, m: int) -> int:
 		raise ValueError("no modular inverse")
 	return x % m
 
+# Validates a batch of inputs in [0, bound) (one range check for the whole array) and returns it as uint64
+def _as_k_bit_array(xs, k: int, bound: Optional[int] = None) -> np.ndarray:
+	if k >= 64:
+		raise ValueError("batch PRP evaluation needs k < 64")
+	if bound is None:
+		bound = 1 << k
+	arr = np.asarray(xs)
+	if arr.size and (arr.min() < 0 or arr.max() >= bound):
+		raise ValueError("input out of range for PRP domain")
+	return arr.astype(np.uint64, copy=False)
+
+# Domain defaults to all of [0, 2^k); a smaller domain must still need k bits (so cycle walking takes < 2 steps on average)
+def _check_domain(domain: Optional[int], k: int) -> int:
+	mod = 1 << k
+	if domain is None:
+		return mod
+	if not (mod // 2 < domain <= mod):
+		raise ValueError(f"domain must be in ({mod // 2}, {mod}] for k={k}")
+	return domain
+
+# Cycle walking: re-apply a permutation of [0, 2^k) until the value lands in [0, domain), a permutation of the smaller domain
+def _cycle_walk(step, x: int, domain: int) -> int:
+	y = step(x)
+	while y >= domain:
+		y = step(y)
+	return y
+
+# Batch cycle walking: only the still-out-of-range elements are stepped again each pass
+def _cycle_walk_many(step, xs: np.ndarray, domain: int) -> np.ndarray:
+	out = step(xs)
+	bound = np.uint64(domain)
+	todo = np.nonzero(out >= bound)[0]
+	while todo.size:
+		out[todo] = step(out[todo])
+		todo = todo[out[todo] >= bound]
+	return out
+
 # Conceptual PRP over k-bit integers using affline permutation mod 2^k
+# With domain < 2^k it permutes [0, domain) by cycle walking (non-power-of-two SEAL n)
 @dataclass(frozen=True)
 class AffinePRP:
 	key: bytes
 	k: int
+	domain: Optional[int] = None
 
 	def __post_init__(self):
 		if self.k <= 0:
 			raise ValueError("k must be positive")
 		
 		mod = 1 << self.k
+		object.__setattr__(self, "domain", _check_domain(self.domain, self.k))
 
 		# Derive 'a' and 'b' from the key deterministically.
 		a = _hash_to_int(self.key, b"SEAL_A") % mod
@@ -45,12 +88,141 @@ class AffinePRP:
 		object.__setattr__(self, "mod", mod)
 		object.__setattr__(self, "a_inv", _modinv(a, mod))
 
+	def _forward(self, x: int) -> int:
+		return (self.a * x + self.b) % self.mod
+
+	def _backward(self, y: int) -> int:
+		return (self.a_inv * (y - self.b)) % self.mod
+
 	def permute(self, x: int) -> int:
-		if x < 0 or x >= self.mod:
+		if x < 0 or x >= self.domain:
 			raise ValueError("x out of range for k-bit PRP")
-		return (self.a * x + self.b) % self.mod
+		return _cycle_walk(self._forward, x, self.domain)
 
 	def inverse(self, y: int) -> int:
-		if y < 0 or y >= self.mod:
+		if y < 0 or y >= self.domain:
 			raise ValueError("y out of range for k-bit PRP")
-		return (self.a_inv * (y - self.b)) % self.mod
+		return _cycle_walk(self._backward, y, self.domain)
+
+	# Batch versions over NumPy arrays; uint64 arithmetic wraps mod 2^64, and 2^k divides 2^64, so masking gives mod 2^k
+	def _forward_many(self, xs: np.ndarray) -> np.ndarray:
+		return (np.uint64(self.a) * xs + np.uint64(self.b)) & np.uint64(self.mod - 1)
+
+	def _backward_many(self, ys: np.ndarray) -> np.ndarray:
+		return (np.uint64(self.a_inv) * (ys - np.uint64(self.b))) & np.uint64(self.mod - 1)
+
+	def permute_many(self, xs) -> np.ndarray:
+		return _cycle_walk_many(self._forward_many, _as_k_bit_array(xs, self.k, self.domain), self.domain)
+
+	def inverse_many(self, ys) -> np.ndarray:
+		return _cycle_walk_many(self._backward_many, _as_k_bit_array(ys, self.k, self.domain), self.domain)
+
+_MASK64 = (1 << 64) - 1
+_MIX1 = 0xBF58476D1CE4E5B9
+_MIX2 = 0x94D049BB133111EB
+
+# splitmix64 finalizer, used as the Feistel round function (scalar and NumPy versions must agree)
+def _mix64(v: int) -> int:
+	v &= _MASK64
+	v ^= v >> 30
+	v = (v * _MIX1) & _MASK64
+	v ^= v >> 27
+	v = (v * _MIX2) & _MASK64
+	v ^= v >> 31
+	return v
+
+def _mix64_many(v: np.ndarray) -> np.ndarray:
+	v = v ^ (v >> np.uint64(30))
+	v = v * np.uint64(_MIX1)
+	v = v ^ (v >> np.uint64(27))
+	v = v * np.uint64(_MIX2)
+	return v ^ (v >> np.uint64(31))
+
+# Keyed balanced Feistel PRP over k-bit integers
+# Runs on 2*ceil(k/2) bits; outputs outside the domain (>= 2^k for odd k, or >= domain) are cycle-walked until they land in range
+# Unlike AffinePRP, every output bit depends on every input bit, so low bits of the input don't pin down low bits of the output
+@dataclass(frozen=True)
+class FeistelPRP:
+	key: bytes
+	k: int
+	rounds: int = 8
+	domain: Optional[int] = None
+
+	def __post_init__(self):
+		if self.k <= 0:
+			raise ValueError("k must be positive")
+		if self.k >= 64:
+			raise ValueError("FeistelPRP needs k < 64")
+		if self.rounds < 3:
+			raise ValueError("rounds must be >= 3")
+
+		half = (self.k + 1) // 2
+		round_keys = tuple(_hash_to_int(self.key, b"SEAL_F" + bytes([r])) for r in range(self.rounds))
+
+		object.__setattr__(self, "mod", 1 << self.k)
+		object.__setattr__(self, "domain", _check_domain(self.domain, self.k))
+		object.__setattr__(self, "half", half)
+		object.__setattr__(self, "half_mask", (1 << half) - 1)
+		object.__setattr__(self, "round_keys", round_keys)
+
+	# ---------- scalar ----------
+
+	def _round(self, r: int, x: int) -> int:
+		return _mix64(x + self.round_keys[r]) & self.half_mask
+
+	def _encrypt(self, x: int) -> int:
+		left, right = x >> self.half, x & self.half_mask
+		for r in range(self.rounds):
+			left, right = right, left ^ self._round(r, right)
+		return (left << self.half) | right
+
+	def _decrypt(self, y: int) -> int:
+		left, right = y >> self.half, y & self.half_mask
+		for r in reversed(range(self.rounds)):
+			left, right = right ^ self._round(r, left), left
+		return (left << self.half) | right
+
+	def permute(self, x: int) -> int:
+		if x < 0 or x >= self.domain:
+			raise ValueError("x out of range for k-bit PRP")
+		return _cycle_walk(self._encrypt, x, self.domain)
+
+	def inverse(self, y: int) -> int:
+		if y < 0 or y >= self.domain:
+			raise ValueError("y out of range for k-bit PRP")
+		return _cycle_walk(self._decrypt, y, self.domain)
+
+	# ---------- batch ----------
+
+	def _round_many(self, r: int, x: np.ndarray) -> np.ndarray:
+		return _mix64_many(x + np.uint64(self.round_keys[r])) & np.uint64(self.half_mask)
+
+	def _encrypt_many(self, x: np.ndarray) -> np.ndarray:
+		half = np.uint64(self.half)
+		left, right = x >> half, x & np.uint64(self.half_mask)
+		for r in range(self.rounds):
+			left, right = right, left ^ self._round_many(r, right)
+		return (left << half) | right
+
+	def _decrypt_many(self, y: np.ndarray) -> np.ndarray:
+		half = np.uint64(self.half)
+		left, right = y >> half, y & np.uint64(self.half_mask)
+		for r in reversed(range(self.rounds)):
+			left, right = right ^ self._round_many(r, left), left
+		return (left << half) | right
+
+	def permute_many(self, xs) -> np.ndarray:
+		return _cycle_walk_many(self._encrypt_many, _as_k_bit_array(xs, self.k, self.domain), self.domain)
+
+	def inverse_many(self, ys) -> np.ndarray:
+		return _cycle_walk_many(self._decrypt_many, _as_k_bit_array(ys, self.k, self.domain), self.domain)
+
+PRP_KINDS = ("affine", "feistel")
+
+# Builds the routing PRP by name (SealRouter / SealClient `prp=` option)
+def make_prp(kind: str, key: bytes, k: int, domain: Optional[int] = None):
+	if kind == "affine":
+		return AffinePRP(key=key, k=k, domain=domain)
+	if kind == "feistel":
+		return FeistelPRP(key=key, k=k, domain=domain)
+	raise ValueError(f"unknown prp kind {kind!r}, expected one of {PRP_KINDS}")
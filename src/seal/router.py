@@ -0,0 +1,56 @@
+# src/seal/router.py
+from __future__ import annotations
+from typing import Optional
+
+import secrets
+
+import numpy as np
+
+from src.seal.partitioning import make_seal_params, SealParams
+from src.seal.prp import make_prp
+
+# Routing half of SEAL: PRP + params only, no sub-ORAM trees
+# Leakage/attack experiments only need route(), so they can use this instead of a full SealClient
+class SealRouter:
+	def __init__(self, n: int, alpha: int, prp_key: Optional[bytes] = None, prp: str = "affine"):
+		self.params: SealParams = make_seal_params(n, alpha)
+
+		if prp_key is None:
+			prp_key = secrets.token_bytes(16)
+		self.prp_key = prp_key
+		self.prp_kind = prp
+		self.prp = make_prp(prp, key=prp_key, k=self.params.k, domain=self.params.n)
+
+		# Full (oram_index, local_id) table for all n ids, built once on demand (see routing_table)
+		self._table: Optional[tuple[np.ndarray, np.ndarray]] = None
+
+	# Returns (oram_index, local_id) based on PRP(global_id)
+	def route(self, global_id: int) -> tuple[int, int]:
+		if not (0 <= global_id < self.params.n):
+			raise ValueError("global_id out of range")
+		j = self.prp.permute(global_id)  # value in [0, n)
+
+		# For n = 2^k this is exactly "top alpha bits = ORAM index, remaining bits = local id"
+		return divmod(j, self.params.local_n)
+
+	# Vectorized route(): arrays of global ids -> (oram_index, local_id) int64 arrays
+	def route_many(self, global_ids) -> tuple[np.ndarray, np.ndarray]:
+		ids = np.asarray(global_ids, dtype=np.int64)
+		if ids.size and (ids.min() < 0 or ids.max() >= self.params.n):
+			raise ValueError("global_id out of range")
+
+		if self._table is not None:
+			oram_index, local_id = self._table
+			return oram_index[ids], local_id[ids]
+
+		j = self.prp.permute_many(ids).astype(np.int64)
+		if self.params.is_power_of_two:
+			shift = self.params.local_k
+			return j >> shift, j & ((1 << shift) - 1)
+		return np.divmod(j, self.params.local_n)
+
+	# Routing for every global id, cached per router (i.e. per PRP key); later route_many calls become lookups
+	def routing_table(self) -> tuple[np.ndarray, np.ndarray]:
+		if self._table is None:
+			self._table = self.route_many(np.arange(self.params.n, dtype=np.int64))
+		return self._table
@@ -1,14 +1,18 @@
 # src/seal/seal_client.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
 
-import secrets
+import numpy as np
 
+from src.path_oram.arena import TreeArena, check_arena_payload
 from src.path_oram.client import PathOramClient
+from src.path_oram.utils import tree_depth_from_n
 from src.path_oram.metrics import OramMetrics, estimate_bandwidth_bytes
-from src.seal.partitioning import make_seal_params, SealParams
-from src.seal.prp import AffinePRP
+from src.seal.access_log import AccessLogRing
+from src.seal.partitioning import SealParams
+from src.seal.router import SealRouter
+from src.seal.telemetry import SealTelemetry
 
 @dataclass
 class SealAccessLog:
@@ -18,9 +22,11 @@ class SealAccessLog:
 	buckets_written: int
 	stash_size: int
 	approx_bandwidth_bytes: int
+	migration: bool = False       # issued by a background/lazy block migration, not by the application
 
-# SEAL wrapper, maintains m = 2^alpha Path ORAMs, of size local_n
+# SEAL wrapper, maintains m = 2^alpha Path ORAMs, of size local_n (the last one may be smaller when n isn't a power of two)
 # Routes each global block_id using j = PRP_k(block_id), oram_index = top alpha bits of j, local_id = remaining bits of j 
+# (in general oram_index = j // local_n, local_id = j % local_n; see make_seal_params)
 class SealClient:
 	def __init__(
 		self,
@@ -29,50 +35,94 @@ class SealClient:
 		alpha: int,
 		block_size_bytes: int = 64,
 		prp_key: Optional[bytes] = None,
+		prp: str = "affine",
 		default_value: Any = 0,
+		lazy: bool = True,
+		arena: bool = False,
+		arena_path: Optional[str] = None,
+		log_capacity: Optional[int] = None,
+		log_spill_dir: Optional[str] = None,
 	):
-		self.params: SealParams = make_seal_params(n, alpha)
+		self.router = SealRouter(n=n, alpha=alpha, prp_key=prp_key, prp=prp)
+		self.params: SealParams = self.router.params
+		self.prp = self.router.prp
 		self.Z = Z
 		self.block_size_bytes = block_size_bytes
 		self.default_value = default_value
 
-		if prp_key is None:
-			prp_key = secrets.token_bytes(16)
-		self.prp = AffinePRP(key=prp_key, k=self.params.k)
+		# Optional shared storage: every sub-ORAM tree lives in one TreeArena (memory-mapped if arena_path is set)
+		self.arena: Optional[TreeArena] = None
+		if arena or arena_path is not None:
+			check_arena_payload(default_value, "default_value")  # sub-ORAMs are lazy, fail at construction instead
+			depths = [tree_depth_from_n(self.params.local_size(i)) for i in range(self.params.m)]
+			self.arena = TreeArena(depths=depths, Z=Z, path=arena_path)
 
-		# Create sub-ORAMs
-		self.sub_orams: list[PathOramClient] = []
-		for _ in range(self.params.m):
-			self.sub_orams.append(PathOramClient.setup(n=self.params.local_n, Z=Z, default_value=default_value))
+		# Sub-ORAMs are created on first touch (lazy=True), so construction is O(1) and untouched partitions cost nothing
+		self.lazy = lazy
+		self.sub_orams: Dict[int, PathOramClient] = {}
+		if not lazy:
+			self.materialize(range(self.params.m))
 		
 		# Optional: keep an access log if you want (useful for Phase 3 attacker)
+		# log_capacity switches the unbounded list to a fixed-size columnar AccessLogRing (spilling chunks to log_spill_dir if set)
+		self.log_capacity = log_capacity
+		self.log_spill_dir = log_spill_dir
 		self.last_access: Optional[SealAccessLog] = None
-		self.access_log: list[SealAccessLog] = []
+		self.access_log: Union[list[SealAccessLog], AccessLogRing] = self._new_log()
+
+		# Running totals over every logged access (not cleared by reset_log), cheap to diff around a batch
+		self.total_accesses = 0
+		self.total_bandwidth_bytes = 0
+
+		# Per-sub-ORAM load / stash / bytes counters (load imbalance across the 2^alpha partitions)
+		self.telemetry = SealTelemetry(self.params.m)
 		
+	def _new_log(self) -> Union[list[SealAccessLog], AccessLogRing]:
+		if self.log_capacity is None:
+			return []
+		return AccessLogRing(capacity=self.log_capacity, num_orams=self.params.m, spill_dir=self.log_spill_dir)
+
 	# Returns (oram_index, local_id) based on PRP(global_id)
 	def route(self, global_id: int) -> tuple[int, int]:
-		if not (0 <= global_id < self.params.n):
-			raise ValueError("global_id out of range")
-		j = self.prp.permute(global_id)  # k-bit value
-
-		# top alpha bits decide the ORAM index
-		if self.params.alpha == 0:
-			oram_index = 0
-			local_id = j  # all bits used as local id
-			return oram_index, local_id
-
-		shift = self.params.local_k
-		oram_index = j >> shift
-		local_mask = (1 << shift) - 1
-		local_id = j & local_mask
-		return oram_index, local_id
+		return self.router.route(global_id)
+
+	def route_many(self, global_ids) -> tuple[np.ndarray, np.ndarray]:
+		return self.router.route_many(global_ids)
+
+	def routing_table(self) -> tuple[np.ndarray, np.ndarray]:
+		return self.router.routing_table()
+
+	def _new_sub_oram(self, oram_index: int) -> PathOramClient:
+		server = self.arena.tree(oram_index) if self.arena is not None else None
+		return PathOramClient.setup(
+			n=self.params.local_size(oram_index),
+			Z=self.Z,
+			default_value=self.default_value,
+			lazy_positions=self.lazy,
+			server=server,
+		)
+
+	# Returns sub-ORAM oram_index, creating its tree and position map if it was never touched
+	def sub_oram(self, oram_index: int) -> PathOramClient:
+		sub = self.sub_orams.get(oram_index)
+		if sub is None:
+			if not (0 <= oram_index < self.params.m):
+				raise ValueError("oram_index out of range")
+			sub = self._new_sub_oram(oram_index)
+			self.sub_orams[oram_index] = sub
+		return sub
+
+	# Eagerly create the given sub-ORAMs (e.g. before a timed run, so setup cost stays out of the measurement)
+	def materialize(self, oram_indices: Iterable[int]) -> None:
+		for oram_index in oram_indices:
+			self.sub_oram(oram_index)
 
 	# Same interface style as Path ORAM, but with global IDs
-	def access(self, op: str, global_id: int, new_data: Any = None) -> Optional[Any]:
+	def access(self, op: str, global_id: int, new_data: Any = None, migration: bool = False) -> Optional[Any]:
 		oram_index, local_id = self.route(global_id)
 		
 		# Reset stats so per-access counters are clean
-		sub = self.sub_orams[oram_index]
+		sub = self.sub_oram(oram_index)
 		sub.server.reset_stats()
 		
 		result = sub.access(op, local_id, new_data)
@@ -83,18 +133,66 @@ class SealClient:
 		stash_size = len(sub.stash)
 		approx_bw = estimate_bandwidth_bytes(br, bw, self.Z, self.block_size_bytes)
 
+		self._log_access(oram_index, local_id, OramMetrics(br, bw, stash_size, approx_bw), migration=migration)
+		return result
+
+	# Batch of (op, global_id[, new_data]) requests: routed in one vectorized step, grouped by sub-ORAM,
+	# and each group runs through PathOramClient.access_many. Results come back in the original order
+	# Requests for the same id keep their relative order (stable grouping); ids in different sub-ORAMs are independent
+	# The whole batch is validated (ops, id range, arena payloads) before any access runs, so a bad request never
+	# leaves the batch partially applied
+	def access_many(self, ops: Sequence[tuple]) -> List[Optional[Any]]:
+		ops = list(ops)
+		results: List[Optional[Any]] = [None] * len(ops)
+		if not ops:
+			return results
+
+		for req in ops:
+			if req[0] not in ("read", "write"):
+				raise ValueError("op must be 'read' or 'write'")
+			if req[0] == "write" and self.arena is not None:
+				check_arena_payload(req[2] if len(req) > 2 else None)
+
+		ids = np.fromiter((req[1] for req in ops), dtype=np.int64, count=len(ops))
+		oram_index, local_id = self.route_many(ids)  # raises on out-of-range ids
+
+		order = np.argsort(oram_index, kind="stable")
+		groups, starts = np.unique(oram_index[order], return_index=True)
+		bounds = starts.tolist() + [len(ops)]
+
+		for g, idx in enumerate(groups.tolist()):
+			positions = order[bounds[g]:bounds[g + 1]].tolist()
+			local = local_id[positions].tolist()
+			sub = self.sub_oram(idx)
+
+			metrics: List[OramMetrics] = []
+			group_ops = [(ops[p][0], lid, ops[p][2] if len(ops[p]) > 2 else None) for p, lid in zip(positions, local)]
+			out = sub.access_many(group_ops, metrics=metrics, block_size_bytes=self.block_size_bytes)
+
+			for p, lid, res, m in zip(positions, local, out, metrics):
+				results[p] = res
+				self._log_access(idx, lid, m)
+
+		return results
+
+	def _log_access(self, oram_index: int, local_id: int, m: OramMetrics, migration: bool = False) -> None:
 		self.last_access = SealAccessLog(
 			oram_index=oram_index,
 			local_id=local_id,
-			buckets_read=br,
-			buckets_written=bw,
-			stash_size=stash_size,
-			approx_bandwidth_bytes=approx_bw,
+			buckets_read=m.buckets_read,
+			buckets_written=m.buckets_written,
+			stash_size=m.stash_size,
+			approx_bandwidth_bytes=m.approx_bandwidth_bytes,
+			migration=migration,
 		)
-
 		self.access_log.append(self.last_access)
-		return result
+		self.total_accesses += 1
+		self.total_bandwidth_bytes += m.approx_bandwidth_bytes
+		self.telemetry.record(oram_index, m.stash_size, m.approx_bandwidth_bytes)
 
 	def reset_log(self) -> None:
-		self.access_log = []
+		if isinstance(self.access_log, AccessLogRing):
+			self.access_log.clear()
+		else:
+			self.access_log = []
 		self.last_access = None
@@ -0,0 +1,70 @@
+# src/seal/telemetry.py
+from __future__ import annotations
+from typing import Any, Dict, List
+
+import numpy as np
+
+# Per-sub-ORAM load and stash counters, updated on every SEAL access (O(1) each)
+# Stash sizes are kept as a per-sub-ORAM histogram, so max and percentiles need no per-access history
+class SealTelemetry:
+	def __init__(self, m: int):
+		self.m = m
+		self.access_counts = np.zeros(m, dtype=np.int64)
+		self.bytes_moved = np.zeros(m, dtype=np.int64)
+		self.stash_max = np.zeros(m, dtype=np.int64)
+		self.stash_hist = np.zeros((m, 16), dtype=np.int64)   # stash_hist[i, s] = accesses of sub-ORAM i that left stash size s
+
+	def record(self, oram_index: int, stash_size: int, bandwidth_bytes: int) -> None:
+		self.access_counts[oram_index] += 1
+		self.bytes_moved[oram_index] += bandwidth_bytes
+		if stash_size > self.stash_max[oram_index]:
+			self.stash_max[oram_index] = stash_size
+		if stash_size >= self.stash_hist.shape[1]:
+			grow = max(stash_size + 1, 2 * self.stash_hist.shape[1])
+			self.stash_hist = np.pad(self.stash_hist, ((0, 0), (0, grow - self.stash_hist.shape[1])))
+		self.stash_hist[oram_index, stash_size] += 1
+
+	def reset(self) -> None:
+		self.__init__(self.m)
+
+	# Per-sub-ORAM stash-size percentile (0 for sub-ORAMs never accessed)
+	def stash_percentile(self, q: float) -> np.ndarray:
+		cum = np.cumsum(self.stash_hist, axis=1)
+		target = np.ceil(self.access_counts * (q / 100.0)).astype(np.int64)
+		out = np.argmax(cum >= np.maximum(target, 1)[:, None], axis=1)
+		return np.where(self.access_counts > 0, out, 0)
+
+	# Coefficient of variation of access counts across sub-ORAMs (0 = perfectly balanced)
+	def imbalance(self) -> float:
+		mean = self.access_counts.mean()
+		return float(self.access_counts.std() / mean) if mean > 0 else 0.0
+
+	# Hottest sub-ORAM's load relative to the mean (bounds parallel speedup across partitions)
+	def max_over_mean(self) -> float:
+		mean = self.access_counts.mean()
+		return float(self.access_counts.max() / mean) if mean > 0 else 0.0
+
+	# One row per sub-ORAM (for CSV export)
+	def rows(self) -> List[Dict[str, Any]]:
+		p50 = self.stash_percentile(50)
+		p99 = self.stash_percentile(99)
+		return [
+			{
+				"oram_index": i,
+				"accesses": int(self.access_counts[i]),
+				"bytes_moved": int(self.bytes_moved[i]),
+				"stash_max": int(self.stash_max[i]),
+				"stash_p50": int(p50[i]),
+				"stash_p99": int(p99[i]),
+			}
+			for i in range(self.m)
+		]
+
+	def summary(self) -> Dict[str, float]:
+		return {
+			"accesses": int(self.access_counts.sum()),
+			"bytes_moved": int(self.bytes_moved.sum()),
+			"stash_max": int(self.stash_max.max()) if self.m else 0,
+			"imbalance_cv": self.imbalance(),
+			"max_over_mean": self.max_over_mean(),
+		}
@@ -1,95 +1,100 @@
 # src/workload/leakage_oracle.py
 from __future__ import annotations
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 
 from src.attacks.padding import next_power_of_x
-from src.attacks.types import EncryptedTuple, QueryObservation
+from src.attacks.streams import chunk_observations
+from src.attacks.types import EncryptedTable, EncryptedTuple, PrefixHistogram, QueryObservation
+from src.seal.router import SealRouter
 from src.seal.seal_client import SealClient
 
 # Produces the leakage trace an attacker sees for "point queries", query(v) returns record IDs where dataset value == v
 # Leakage per query: observed_volume (potentially padded), list of alpha-prefixes for each returned tuple (oram_index) 
+# Only routing is needed, so `seal` can be a routing-only SealRouter (no trees) or a full SealClient
+# compact=True emits observations as prefix histograms (PrefixHistogram) instead of one list entry per returned tuple
 @dataclass
 class SealLeakageOracle:
-	seal: SealClient
+	seal: Union[SealRouter, SealClient]
 	dataset_index: Dict[Any, np.ndarray]
 	padding_x: Optional[int] = None
 	rng_seed: int = 1234
+	compact: bool = False
+	_prefix: Optional[np.ndarray] = field(default=None, init=False, repr=False)
 
 	# Build enc(T) with one EncryptedTuple per real record (attacker doesn't see value in reality, but we store to score correctness)
 	def build_encrypted_tuples(self) -> List[EncryptedTuple]:
+		prefix_of = self.prefix_array()
+
 		enc: List[EncryptedTuple] = []
 		enc_id = 0
 		for value, ids in self.dataset_index.items():
-			for rid in ids.tolist():
-				oram_index, _ = self.seal.route(int(rid))
-				enc.append(EncryptedTuple(enc_id=enc_id, value=value, alpha_prefix=oram_index))
+			for prefix in prefix_of[ids].tolist():
+				enc.append(EncryptedTuple(enc_id=enc_id, value=value, alpha_prefix=prefix))
 				enc_id += 1
 		return enc
 
+	# Columnar enc(T): same rows and enc_ids as build_encrypted_tuples, built with array ops and grouped by prefix
+	def build_encrypted_table(self) -> EncryptedTable:
+		values = list(self.dataset_index.keys())
+		id_arrays = list(self.dataset_index.values())
+		sizes = np.array([ids.size for ids in id_arrays], dtype=np.int64)
+		ids = np.concatenate(id_arrays) if id_arrays else np.array([], dtype=np.int64)
+
+		return EncryptedTable.from_columns(
+			enc_id=np.arange(ids.size, dtype=np.int64),
+			value=np.repeat(np.array(values), sizes),
+			alpha_prefix=self.prefix_array()[ids],
+			m=self.seal.params.m,
+		)
+
 	# Create one query per distinct value (worst-case style), returns list of (true_value, QueryObservation)
 	def observe_all_queries(self) -> List[Tuple[Any, QueryObservation]]:
-		import random
-		rnd = random.Random(self.rng_seed)
+		rng = np.random.default_rng(self.rng_seed)
 
 		obs_list: List[Tuple[Any, QueryObservation]] = []
-		token_id = 0
-
-		for value, ids in self.dataset_index.items():
-			real_ids = ids.astype(np.int64)
-			real_prefixes: List[int] = []
-			for rid in real_ids.tolist():
-				oram_index, _ = self.seal.route(int(rid))
-				real_prefixes.append(oram_index)
-
-			real_vol = len(real_prefixes)
-			padded_vol = next_power_of_x(real_vol, self.padding_x)
-
-			# Add dummy prefixes if padding increases volume
-			if padded_vol > real_vol:
-				extra = padded_vol - real_vol
-				# Dummy prefixes are just random ORAM choices (attacker sees only prefix)
-				for _ in range(extra):
-					real_prefixes.append(rnd.randrange(1 << self.seal.params.alpha) if self.seal.params.alpha > 0 else 0)
-
-			obs = QueryObservation(
-				token_id=token_id,
-				observed_volume=padded_vol,
-				returned_prefixes=real_prefixes,
-			)
-			obs_list.append((value, obs))
-			token_id += 1
+		for token_id, (value, ids) in enumerate(self.dataset_index.items()):
+			obs_list.append((value, self._observe_ids(ids, token_id, rng)))
 		return obs_list
 
 	# Observe leakage for a single query on plaintext value, returns (truevalue, QueryObservation)
+	# Dummies come from a per-token generator (rng_seed + token_id), only built when padding adds any
 	def observe_query(self, value: Any, token_id: int) -> Tuple[Any, QueryObservation]:
-		import random
-		rnd = random.Random(self.rng_seed + token_id)
-
 		ids = self.dataset_index.get(value, np.array([], dtype=np.int64))
-		prefixes: List[int] = []
-		for rid in ids.tolist():
-			oram_index, _ = self.seal.route(int(rid))
-			prefixes.append(oram_index)
+		return value, self._observe_ids(ids, token_id)
 
-		real_vol = len(prefixes)
-		padded_vol = next_power_of_x(real_vol, self.padding_x)
+	# prefix[record_id] = oram_index of that record, computed once per SEAL instance
+	def prefix_array(self) -> np.ndarray:
+		if self._prefix is None:
+			self._prefix, _ = self.seal.routing_table()
+		return self._prefix
 
-		# If padding increases the response size, add dummy prefixes
+	# Real prefixes by fancy-indexing the prefix array; if padding increases the response size, dummy prefixes
+	# are uniform ORAM choices drawn from `rng`, or from a fresh per-token generator when rng is None (attacker sees only prefix)
+	def _observe_ids(self, ids: np.ndarray, token_id: int, rng: Optional[np.random.Generator] = None) -> QueryObservation:
+		prefixes = self.prefix_array()[ids]
+
+		real_vol = int(prefixes.size)
+		padded_vol = next_power_of_x(real_vol, self.padding_x)
 		if padded_vol > real_vol:
-			extra = padded_vol - real_vol
-			m = (1 << self.seal.params.alpha) if self.seal.params.alpha > 0 else 1
-			for _ in range(extra):
-				prefixes.append(rnd.randrange(m))
+			if rng is None:
+				rng = np.random.default_rng(self.rng_seed + token_id)
+			dummies = rng.integers(0, self.seal.params.m, size=padded_vol - real_vol)
+			prefixes = np.concatenate([prefixes, dummies])
 
-		obs = QueryObservation(
+		if self.compact:
+			return QueryObservation(
+				token_id=token_id,
+				observed_volume=padded_vol,
+				prefix_hist=PrefixHistogram.from_prefixes(prefixes, self.seal.params.m),
+			)
+		return QueryObservation(
 			token_id=token_id,
 			observed_volume=padded_vol,
-			returned_prefixes=prefixes,
+			returned_prefixes=prefixes.tolist(),
 		)
-		return value, obs
 
 	# Build a stream of observations for a sequence of distinct plaintext query-values, token_id is stable per position in stream
 	def observe_query_stream(self, values_in_order: List[Any]) -> List[Tuple[Any, QueryObservation]]:
@@ -97,3 +102,13 @@ class SealLeakageOracle:
 		for t, v in enumerate(values_in_order):
 			out.append(self.observe_query(v, token_id=t))
 		return out
+
+	# Lazy version of observe_query_stream: yields observations one at a time, or lists of up to chunk_size
+	# Observations are identical to the list version; peak memory doesn't grow with stream length
+	def iter_query_stream(
+		self,
+		values_in_order: Iterable[Any],
+		chunk_size: Optional[int] = None,
+	) -> Iterator[Union[Tuple[Any, QueryObservation], List[Tuple[Any, QueryObservation]]]]:
+		pairs = (self.observe_query(v, token_id=t) for t, v in enumerate(values_in_order))
+		return pairs if chunk_size is None else chunk_observations(pairs, chunk_size)
@@ -1,12 +1,13 @@
 # src/workload/path_oram_oracle.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 
-from src.attacks.types import QueryObservation
+from src.attacks.types import PrefixHistogram, QueryObservation
 from src.attacks.padding import next_power_of_x
+from src.attacks.streams import chunk_observations
 
 # Baseline leakage-free oracle for comparing vs SEAL attacks; exposed: observed_volume, returned_prefixes
 @dataclass
@@ -14,14 +15,17 @@ class PathOramLeakageOracle:
 	dataset_index: Dict[Any, np.ndarray]
 	constant_volume: int = 1
 	padding_x: Optional[int] = None
+	compact: bool = False      # emit an (empty) PrefixHistogram instead of an empty prefix list
 
 	def observe_query(self, value: Any, token_id: int) -> Tuple[Any, QueryObservation]:
 		vol = self.constant_volume
 		vol = next_power_of_x(vol, self.padding_x)  # optional padding
+		empty = np.array([], dtype=np.int64)
 		obs = QueryObservation(
 			token_id=token_id,
 			observed_volume=vol,
 			returned_prefixes=[],
+			prefix_hist=PrefixHistogram(prefixes=empty, counts=empty) if self.compact else None,
 		)
 
 		return value, obs
@@ -31,3 +35,11 @@ class PathOramLeakageOracle:
 		for t, v in enumerate(values_in_order):
 			out.append(self.observe_query(v, token_id=t))
 		return out
+
+	def iter_query_stream(
+		self,
+		values_in_order: Iterable[Any],
+		chunk_size: Optional[int] = None,
+	) -> Iterator[Union[Tuple[Any, QueryObservation], List[Tuple[Any, QueryObservation]]]]:
+		pairs = (self.observe_query(v, token_id=t) for t, v in enumerate(values_in_order))
+		return pairs if chunk_size is None else chunk_observations(pairs, chunk_size)
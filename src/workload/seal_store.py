@@ -0,0 +1,71 @@
+# src/workload/seal_store.py
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import time
+
+import numpy as np
+
+from src.attacks.padding import next_power_of_x
+from src.seal.seal_client import SealClient
+from src.workload.synthetic import SyntheticDataset
+
+@dataclass(frozen=True)
+class StoreQueryResult:
+	value: Any
+	records: List[Tuple[int, Any]]   # (record_id, stored value) for the real matches
+	real_volume: int
+	padded_volume: int               # ORAM accesses actually issued (real + dummy)
+	seconds: float
+	bandwidth_bytes: int
+
+# End-to-end SEAL record store: records live in SealClient as blocks (block i = record i),
+# the client keeps the value -> ids index, and query(value) fetches every match through ORAM
+# With padding_x, dummy reads of random ids bring the access count up to next_power_of_x(volume)
+# Unlike SealLeakageOracle (which only simulates leakage), this pays the real per-query ORAM cost
+class SealRecordStore:
+	def __init__(self, seal: SealClient, padding_x: Optional[int] = None, rng_seed: int = 0, batch_size: int = 4096):
+		self.seal = seal
+		self.padding_x = padding_x
+		self.batch_size = batch_size
+		self.rng = np.random.default_rng(rng_seed)
+		self.index: Dict[Any, np.ndarray] = {}
+
+	# Writes every record of the dataset into ORAM (batched) and keeps its index client-side
+	# Returns (seconds, bandwidth_bytes) spent loading
+	def load(self, ds: SyntheticDataset) -> Tuple[float, int]:
+		if ds.n > self.seal.params.n:
+			raise ValueError("dataset has more records than the SEAL store")
+		self.index = ds.index
+
+		bytes0 = self.seal.total_bandwidth_bytes
+		t0 = time.perf_counter()
+		values = ds.values.tolist()
+		for start in range(0, ds.n, self.batch_size):
+			stop = min(start + self.batch_size, ds.n)
+			self.seal.access_many([("write", rid, values[rid]) for rid in range(start, stop)])
+		return time.perf_counter() - t0, self.seal.total_bandwidth_bytes - bytes0
+
+	def query(self, value: Any) -> StoreQueryResult:
+		ids = self.index.get(value, np.array([], dtype=np.int64))
+		real_vol = int(ids.size)
+		padded_vol = next_power_of_x(real_vol, self.padding_x)
+
+		# Dummy fetches are reads of uniformly random ids; the server can't tell them from real ones
+		dummies = self.rng.integers(0, self.seal.params.n, size=padded_vol - real_vol)
+		ops = [("read", rid) for rid in ids.tolist()] + [("read", rid) for rid in dummies.tolist()]
+
+		bytes0 = self.seal.total_bandwidth_bytes
+		t0 = time.perf_counter()
+		out = self.seal.access_many(ops)
+		seconds = time.perf_counter() - t0
+
+		return StoreQueryResult(
+			value=value,
+			records=list(zip(ids.tolist(), out[:real_vol])),
+			real_volume=real_vol,
+			padded_volume=padded_vol,
+			seconds=seconds,
+			bandwidth_bytes=self.seal.total_bandwidth_bytes - bytes0,
+		)
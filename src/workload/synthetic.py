@@ -1,30 +1,48 @@
 # src/workload/synthetic.py
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 
 # Plaintext dataset: values[i] is plaintext attribute value for record i, index maps each value -> list of record IDs where it appears
+# The index is also kept in CSR form: record IDs with value v are csr_ids[csr_offsets[v]:csr_offsets[v+1]] (index entries are views into csr_ids)
 @dataclass(frozen=True)
 class SyntheticDataset:
 	n: int
 	values: np.ndarray
 	index: Dict[int, np.ndarray]
+	csr_offsets: Optional[np.ndarray] = None
+	csr_ids: Optional[np.ndarray] = None
 	
 	def value_counts(self) -> Dict[int, int]:
+		if self.csr_offsets is not None:
+			counts = np.diff(self.csr_offsets)
+			present = np.nonzero(counts)[0]
+			return dict(zip(present.tolist(), counts[present].tolist()))
 		return {v: int(ids.size) for v, ids in self.index.items()}
 
+# One stable argsort + bincount: O(n log n) instead of one full scan per value
+# Returns (offsets, ids) with offsets of length vocab+1; ids of each value stay in ascending record order
+def build_csr_index(values: np.ndarray, vocab: int) -> Tuple[np.ndarray, np.ndarray]:
+	counts = np.bincount(values, minlength=vocab)
+	offsets = np.zeros(vocab + 1, dtype=np.int64)
+	np.cumsum(counts, out=offsets[1:])
+	ids = np.argsort(values, kind="stable").astype(np.int32)
+	return offsets, ids
+
+# Dict-of-arrays view over a CSR index (only values that occur), in ascending value order
+def csr_to_index(offsets: np.ndarray, ids: np.ndarray) -> Dict[int, np.ndarray]:
+	bounds = offsets.tolist()
+	return {v: ids[bounds[v]:bounds[v + 1]] for v in range(len(bounds) - 1) if bounds[v + 1] > bounds[v]}
+
 # Generates a skewed dataset, making volume-based attacks meaningful (vocab is number of distinct plaintext values)
 def make_zipf_dataset(n: int, vocab: int = 2**12, a: float = 1.2, seed: int = 0) -> SyntheticDataset:
 	rng = np.random.default_rng(seed)
 	raw = rng.zipf(a=a, size=n)
 	values = (raw % vocab).astype(np.int32)
 
-	index: Dict[int, np.ndarray] = {}
-	for v in range(vocab):
-		ids = np.nonzero(values == v)[0]
-		if ids.size > 0:
-			index[int(v)] = ids.astype(np.int32)
+	offsets, ids = build_csr_index(values, vocab)
+	index = csr_to_index(offsets, ids)
 
-	return SyntheticDataset(n=n, values=values, index=index)
+	return SyntheticDataset(n=n, values=values, index=index, csr_offsets=offsets, csr_ids=ids)
@@ -0,0 +1,31 @@
+# tests/bench_prp.py
+import secrets
+import time
+
+import numpy as np
+
+from src.seal.prp import AffinePRP, FeistelPRP
+
+def _rate(fn, count: int) -> float:
+	t0 = time.perf_counter()
+	fn()
+	return count / (time.perf_counter() - t0)
+
+def bench():
+	key = secrets.token_bytes(16)
+	scalar_n = 1 << 14
+
+	for k in [16, 20, 21]:
+		n = 1 << k
+		xs = np.arange(n, dtype=np.int64)
+		for prp in [AffinePRP(key=key, k=k), FeistelPRP(key=key, k=k)]:
+			batch = _rate(lambda: prp.permute_many(xs), n)
+			scalar = _rate(lambda: [prp.permute(i) for i in range(scalar_n)], scalar_n)
+			print(
+				f"k={k:2d}  {type(prp).__name__:11s}  "
+				f"batch={batch / 1e6:8.2f} M ids/s  "
+				f"scalar={scalar / 1e6:6.3f} M ids/s"
+			)
+
+if __name__ == "__main__":
+	bench()
@@ -0,0 +1,78 @@
+# tests/test_access_log_ring.py
+import os
+import random
+import tempfile
+
+import numpy as np
+
+from src.seal.seal_client import SealClient
+
+def test_access_log_ring():
+	n = 128
+	alpha = 2
+
+	# Reference: unbounded list log
+	seal = SealClient(n=n, Z=4, alpha=alpha, default_value=0, prp_key=b"k" * 16)
+	ring_seal = SealClient(n=n, Z=4, alpha=alpha, default_value=0, prp_key=b"k" * 16, log_capacity=50)
+
+	for _ in range(120):
+		i = random.randrange(n)
+		seal.access("read", i)
+		ring_seal.access("read", i)
+
+	ring = ring_seal.access_log
+	assert len(ring) == 50 and ring.total == 120
+
+	# Ring keeps the newest entries in order
+	tail = seal.access_log[-50:]
+	assert ring.column("oram_index").tolist() == [e.oram_index for e in tail]
+	assert ring.column("local_id").tolist() == [e.local_id for e in tail]
+
+	counts = ring.per_oram_counts()
+	assert counts.shape == (1 << alpha,) and counts.sum() == 50
+	assert abs(ring.means()["approx_bandwidth_bytes"] - np.mean([e.approx_bandwidth_bytes for e in tail])) < 1e-9
+	assert set(ring.percentiles("stash_size").keys()) == {50, 90, 99}
+
+	ring_seal.reset_log()
+	assert len(ring_seal.access_log) == 0
+
+	# Spill mode: every full chunk lands on disk, nothing is lost
+	with tempfile.TemporaryDirectory() as d:
+		spill = SealClient(n=n, Z=4, alpha=alpha, default_value=0, log_capacity=32, log_spill_dir=d)
+		for _ in range(100):
+			spill.access("read", random.randrange(n))
+		log = spill.access_log
+		assert len(log.spilled_chunks) == 3 and len(log) == 4
+		assert sum(c["oram_index"].size for c in log.iter_chunks()) == 100
+
+	# Summaries survive spills: right after 2 * capacity accesses the buffer is empty but nothing is forgotten
+	with tempfile.TemporaryDirectory() as d:
+		ref = SealClient(n=n, Z=4, alpha=alpha, default_value=0, prp_key=b"s" * 16)
+		spill = SealClient(n=n, Z=4, alpha=alpha, default_value=0, prp_key=b"s" * 16, log_capacity=32, log_spill_dir=d)
+		for _ in range(64):
+			i = random.randrange(n)
+			ref.access("read", i)
+			spill.access("read", i)
+		log = spill.access_log
+		assert len(log) == 0 and len(log.spilled_chunks) == 2
+		entries = ref.access_log
+		assert log.per_oram_counts().tolist() == np.bincount([e.oram_index for e in entries], minlength=1 << alpha).tolist()
+		assert abs(log.means()["approx_bandwidth_bytes"] - np.mean([e.approx_bandwidth_bytes for e in entries])) < 1e-9
+		assert log.percentiles("approx_bandwidth_bytes")[50] == np.percentile([e.approx_bandwidth_bytes for e in entries], 50)
+		assert log.per_oram_sum("buckets_read").sum() == sum(e.buckets_read for e in entries)
+		assert log.migration_bytes()["foreground"] == sum(e.approx_bandwidth_bytes for e in entries)
+
+		# reset drops the old chunk files and never reuses a chunk name
+		old = list(log.spilled_chunks)
+		spill.reset_log()
+		for _ in range(32):
+			spill.access("read", random.randrange(n))
+		log = spill.access_log
+		assert not any(os.path.exists(p) for p in old)
+		assert log.spilled_chunks[0] not in old and log.spilled_chunks[0].endswith("access_log_000002.npz")
+		assert log.per_oram_counts().sum() == 32
+
+	print("OK: access log ring test passed")
+
+if __name__ == "__main__":
+	test_access_log_ring()
@@ -0,0 +1,45 @@
+# tests/test_encrypted_table.py
+import numpy as np
+
+from src.seal.router import SealRouter
+from src.workload.synthetic import make_zipf_dataset
+from src.workload.leakage_oracle import SealLeakageOracle
+from src.attacks.database_recovery import database_recovery_attack
+from src.attacks.types import EncryptedTable
+
+def test_encrypted_table_matches_tuples():
+	n = 1 << 11
+	alpha = 3
+	ds = make_zipf_dataset(n=n, vocab=128, a=1.2, seed=8)
+	counts = ds.value_counts()
+	values = list(ds.index.keys())
+	seal = SealRouter(n=n, alpha=alpha)
+	oracle = SealLeakageOracle(seal=seal, dataset_index=ds.index, padding_x=2, rng_seed=5)
+
+	tuples = oracle.build_encrypted_tuples()
+	table = oracle.build_encrypted_table()
+	assert len(table) == len(tuples) == n
+	assert table.offsets[0] == 0 and table.offsets[-1] == n
+	assert np.all(np.diff(table.alpha_prefix) >= 0)
+
+	# Same rows as the tuple list, grouped by prefix with enc_id order kept inside each prefix
+	by_id = {t.enc_id: t for t in tuples}
+	for e, v, p in zip(table.enc_id.tolist(), table.value.tolist(), table.alpha_prefix.tolist()):
+		assert by_id[e].value == v and by_id[e].alpha_prefix == p
+	for p in range(seal.params.m):
+		ids = table.enc_id[table.offsets[p]:table.offsets[p + 1]]
+		assert np.all(np.diff(ids) > 0)
+		assert table.prefix_values(p).tolist() == [t.value for t in tuples if t.alpha_prefix == p]
+
+	rebuilt = EncryptedTable.from_tuples(tuples, seal.params.m)
+	assert np.array_equal(rebuilt.enc_id, table.enc_id) and np.array_equal(rebuilt.offsets, table.offsets)
+
+	# DRSR is identical whichever form of enc(T) is passed
+	obs = oracle.observe_query_stream(values)
+	for seed in (0, 1, 2):
+		assert database_recovery_attack(counts, tuples, obs, x=2, rng_seed=seed) == database_recovery_attack(counts, table, obs, x=2, rng_seed=seed)
+
+	print("OK: encrypted table test passed")
+
+if __name__ == "__main__":
+	test_encrypted_table_matches_tuples()
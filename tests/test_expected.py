@@ -0,0 +1,68 @@
+# tests/test_expected.py
+import numpy as np
+
+from src.seal.router import SealRouter
+from src.workload.synthetic import make_zipf_dataset
+from src.workload.leakage_oracle import SealLeakageOracle
+from src.attacks.expected import expected_success
+from src.attacks.types import EncryptedTuple, QueryObservation
+from src.eval.checkpoints import CheckpointSpec
+from src.eval.padding_eval import evaluate_padding_sweep
+from src.eval.phase3_runner import RunConfig, evaluate_over_time
+
+def test_expected_small_by_hand():
+	counts = {"a": 2, "b": 2, "c": 3}
+	enc = [EncryptedTuple(0, "a", 0), EncryptedTuple(1, "a", 1), EncryptedTuple(2, "b", 0), EncryptedTuple(3, "b", 1),
+		EncryptedTuple(4, "c", 0), EncryptedTuple(5, "c", 0), EncryptedTuple(6, "c", 1)]
+	obs = [
+		("a", QueryObservation(token_id=0, observed_volume=2, returned_prefixes=[0, 1])),
+		("b", QueryObservation(token_id=1, observed_volume=2, returned_prefixes=[0, 1])),
+		("c", QueryObservation(token_id=2, observed_volume=3, returned_prefixes=[0, 0, 1])),
+	]
+	e = expected_success(counts, obs, enc)
+	# buckets {2: [a, b], 3: [c]}: 1/2, 1/2, 1
+	assert np.allclose(e.per_query_qrsr, [0.5, 0.5, 1.0]) and np.isclose(e.qrsr, 2 / 3)
+	# pool 0 = {a, b, c, c}, pool 1 = {a, b, c}; S[{a,b}, 0] = 2, S[{a,b}, 1] = 2, S[{c}, 0] = 2, S[{c}, 1] = 1
+	# query c draws 2 of the 2 left in pool 0 and 1 of the 1 left in pool 1
+	assert np.allclose(e.per_query_hits, [0.5 * (2 / 4 + 2 / 3), 0.5 * (2 / 4 + 2 / 3), 1.0 * (2 * 2 / 4 + 1 / 3)])
+	assert e.per_query_draws.tolist() == [2, 2, 3]
+	assert [t for t, _, _ in e.curve([1, 10])] == [1, 3]
+
+def test_expected_matches_sampling():
+	n = 1 << 11
+	ds = make_zipf_dataset(n=n, vocab=256, a=1.2, seed=5)
+	counts = ds.value_counts()
+	values = list(ds.index.keys())
+	for alpha, x in ((0, None), (2, 2), (3, 4)):
+		oracle = SealLeakageOracle(seal=SealRouter(n=n, alpha=alpha), dataset_index=ds.index, padding_x=x, rng_seed=1, compact=True)
+		encT = oracle.build_encrypted_table()
+		e = expected_success(counts, oracle.iter_query_stream(values[:200]), encT, x=x, cross_check=400, rng_seed=3)
+		z = e.z_scores()
+		assert abs(z["qrsr"]) < 5 and abs(z["drsr"]) < 5
+		assert np.allclose(e.curve()[-1][1:], (e.qrsr, e.drsr))
+
+# The over-time and padding sweeps report the same expectation as calling expected_success directly
+def test_expected_in_sweeps():
+	n = 1 << 11
+	ds = make_zipf_dataset(n=n, vocab=256, a=1.2, seed=6)
+	counts = ds.value_counts()
+	values = list(ds.index.keys())[:150]
+	key = b"e" * 16
+	oracle = SealLeakageOracle(seal=SealRouter(n=n, alpha=2, prp_key=key), dataset_index=ds.index, padding_x=2, rng_seed=4)
+	e = expected_success(counts, oracle.observe_query_stream(values), oracle.build_encrypted_table(), x=2)
+
+	points = [1, 50, 1000]
+	cfg = RunConfig(n=n, Z=4, alphas=[2], padding_x=2, rng_seed=4, checkpoints=CheckpointSpec(points=points), prp_key=key, expected=True)
+	ts = evaluate_over_time(ds.index, counts, values, cfg)
+	assert ts.expected[2] == e.curve(points)
+	assert [t for t, _, _ in ts.expected[2]] == [t for t, _, _ in ts.series[2]]
+	assert evaluate_over_time(ds.index, counts, values, RunConfig(n=n, Z=4, alphas=[2], prp_key=key)).expected == {}
+
+	row = evaluate_padding_sweep(ds.index, counts, values, n=n, Z=4, alphas=[2], xs=[2], rng_seed=4, prp_key=key, expected=True)[0]
+	assert (row.exp_qrsr, row.exp_drsr) == (e.qrsr, e.drsr)
+
+if __name__ == "__main__":
+	test_expected_small_by_hand()
+	test_expected_matches_sampling()
+	test_expected_in_sweeps()
+	print("OK: expected success test passed")
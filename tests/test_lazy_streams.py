@@ -0,0 +1,43 @@
+# tests/test_lazy_streams.py
+import types
+
+from src.seal.router import SealRouter
+from src.workload.synthetic import make_zipf_dataset
+from src.workload.leakage_oracle import SealLeakageOracle
+from src.workload.path_oram_oracle import PathOramLeakageOracle
+from src.attacks.query_recovery import query_recovery_attack
+from src.attacks.database_recovery import database_recovery_attack
+
+def test_lazy_streams():
+	n = 1 << 10
+	ds = make_zipf_dataset(n=n, vocab=128, a=1.2, seed=2)
+	counts = ds.value_counts()
+	values = list(ds.index.keys())
+
+	oracle = SealLeakageOracle(seal=SealRouter(n=n, alpha=3), dataset_index=ds.index, padding_x=2, rng_seed=4)
+	eager = oracle.observe_query_stream(values)
+	encT = oracle.build_encrypted_tuples()
+
+	lazy = oracle.iter_query_stream(values)
+	assert isinstance(lazy, types.GeneratorType)
+	assert list(lazy) == eager
+
+	chunks = list(oracle.iter_query_stream(values, chunk_size=10))
+	assert all(len(c) <= 10 for c in chunks)
+	assert [p for c in chunks for p in c] == eager
+
+	# Attacks give the same answer on a list, a generator and a chunked generator
+	q = query_recovery_attack(counts, eager, x=2, rng_seed=3)
+	d = database_recovery_attack(counts, encT, eager, x=2, rng_seed=3)
+	for stream in (oracle.iter_query_stream(values), oracle.iter_query_stream(values, chunk_size=7)):
+		assert query_recovery_attack(counts, stream, x=2, rng_seed=3) == q
+	for stream in (oracle.iter_query_stream(values), oracle.iter_query_stream(values, chunk_size=7)):
+		assert database_recovery_attack(counts, encT, stream, x=2, rng_seed=3) == d
+
+	baseline = PathOramLeakageOracle(dataset_index=ds.index)
+	assert list(baseline.iter_query_stream(values)) == baseline.observe_query_stream(values)
+
+	print("OK: lazy observation stream test passed")
+
+if __name__ == "__main__":
+	test_lazy_streams()
@@ -0,0 +1,55 @@
+# tests/test_monte_carlo.py
+import numpy as np
+
+from src.seal.router import SealRouter
+from src.workload.synthetic import make_zipf_dataset
+from src.workload.leakage_oracle import SealLeakageOracle
+from src.attacks.query_recovery import query_recovery_attack
+from src.attacks.database_recovery import database_recovery_attack
+from src.attacks.monte_carlo import monte_carlo_attacks
+from src.eval.padding_eval import evaluate_padding_sweep
+
+def test_monte_carlo_matches_sequential():
+	n = 1 << 11
+	ds = make_zipf_dataset(n=n, vocab=256, a=1.2, seed=2)
+	counts = ds.value_counts()
+	values = list(ds.index.keys())
+	oracle = SealLeakageOracle(seal=SealRouter(n=n, alpha=2), dataset_index=ds.index, padding_x=2, rng_seed=4, compact=True)
+	encT = oracle.build_encrypted_table()
+	obs = oracle.observe_query_stream(values[:150])
+
+	R = 300
+	mc = monte_carlo_attacks(counts, obs, encT, x=2, replicates=R, rng_seed=1, block=64)
+	assert mc.qrsr.shape == (R,) and mc.drsr.shape == (R,)
+	assert np.all((0 <= mc.qrsr) & (mc.qrsr <= 1)) and np.all((0 <= mc.drsr) & (mc.drsr <= 1))
+
+	seq_q = np.array([query_recovery_attack(counts, obs, x=2, rng_seed=s) for s in range(R)])
+	seq_d = np.array([database_recovery_attack(counts, encT, obs, x=2, rng_seed=s) for s in range(R)])
+	# means agree within a few standard errors
+	assert abs(mc.qrsr.mean() - seq_q.mean()) < 4 * np.sqrt((mc.qrsr.var() + seq_q.var()) / R) + 1e-9
+	assert abs(mc.drsr.mean() - seq_d.mean()) < 4 * np.sqrt((mc.drsr.var() + seq_d.var()) / R) + 1e-9
+
+	# same seed and block -> same vectors; the tuple-list form of enc(T) is accepted too
+	again = monte_carlo_attacks(counts, obs, oracle.build_encrypted_tuples(), x=2, replicates=R, rng_seed=1, block=64)
+	assert np.array_equal(again.qrsr, mc.qrsr) and np.array_equal(again.drsr, mc.drsr)
+
+	# without padding, a value whose count is unique sits alone in its bucket and is always recovered
+	unpadded = SealLeakageOracle(seal=SealRouter(n=n, alpha=2), dataset_index=ds.index).observe_query_stream(values)
+	mc0 = monte_carlo_attacks(counts, unpadded, replicates=8, rng_seed=0)
+	sizes = list(counts.values())
+	alone = sum(1 for c in sizes if sizes.count(c) == 1) / len(values)
+	assert mc0.drsr is None and np.all(mc0.qrsr >= alone)
+
+	# the padding sweep reports the spread over attacker seeds when asked
+	sweep = dict(dataset_index=ds.index, value_counts=counts, query_values_in_order=values[:150], n=n, Z=4, alphas=[2],
+		xs=[2], rng_seed=1, prp_key=b"k" * 16)
+	row = evaluate_padding_sweep(**sweep, replicates=R)[0]
+	keyed = SealLeakageOracle(seal=SealRouter(n=n, alpha=2, prp_key=b"k" * 16), dataset_index=ds.index, padding_x=2, rng_seed=1)
+	ref = monte_carlo_attacks(counts, keyed.observe_query_stream(values[:150]), keyed.build_encrypted_table(), x=2,
+		replicates=R, rng_seed=1).summary()
+	assert (row.qrsr_mean, row.qrsr_std, row.drsr_mean, row.drsr_std) == (ref["qrsr_mean"], ref["qrsr_std"], ref["drsr_mean"], ref["drsr_std"])
+	assert evaluate_padding_sweep(**sweep)[0].qrsr_mean is None
+	print("OK: monte carlo test passed")
+
+if __name__ == "__main__":
+	test_monte_carlo_matches_sequential()
@@ -1,4 +1,5 @@
 # tests/test_oracle_stream.py
+from src.seal.router import SealRouter
 from src.seal.seal_client import SealClient
 from src.workload.synthetic import make_zipf_dataset
 from src.workload.leakage_oracle import SealLeakageOracle
@@ -24,5 +25,30 @@ def test_oracle_stream():
 
 	print("OK: oracle stream test passed")
 
+def test_oracle_prefix_array_padded():
+	n = 1 << 10
+	alpha = 3
+
+	ds = make_zipf_dataset(n=n, vocab=128, a=1.2, seed=3)
+	seal = SealRouter(n=n, alpha=alpha)
+	oracle = SealLeakageOracle(seal=seal, dataset_index=ds.index, padding_x=4, rng_seed=5)
+
+	prefix = oracle.prefix_array()
+	assert prefix.tolist() == [seal.route(i)[0] for i in range(n)]
+
+	values = list(ds.index.keys())[:25]
+	for t, v in enumerate(values):
+		_, qobs = oracle.observe_query(v, token_id=t)
+		real = ds.index[v]
+		assert qobs.observed_volume == len(qobs.returned_prefixes) >= real.size
+		assert qobs.returned_prefixes[:real.size] == prefix[real].tolist()
+		assert all(0 <= p < (1 << alpha) for p in qobs.returned_prefixes)
+
+		# same token -> same dummy prefixes
+		assert oracle.observe_query(v, token_id=t)[1] == qobs
+
+	print("OK: oracle prefix-array test passed")
+
 if __name__ == "__main__":
 	test_oracle_stream()
+	test_oracle_prefix_array_padded()
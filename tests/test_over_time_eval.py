@@ -1,7 +1,12 @@
 # tests/test_over_time_eval.py
 from src.workload.synthetic import make_zipf_dataset
 from src.eval.workloads import WorkloadSpec, make_uniform_distinct
+from src.eval.checkpoints import CheckpointSpec
 from src.eval.phase3_runner import RunConfig, evaluate_over_time
+from src.seal.router import SealRouter
+from src.workload.leakage_oracle import SealLeakageOracle
+from src.attacks.query_recovery import QueryRecoveryAttacker, query_recovery_attack
+from src.attacks.database_recovery import DatabaseRecoveryAttacker, database_recovery_attack
 
 def test_over_time_eval():
 	n = 1 << 12
@@ -26,5 +31,37 @@ def test_over_time_eval():
 
 	print("OK: over-time eval test passed")
 
+# Resumable attackers after t observations must match re-running both attacks from scratch on observations[:t]
+def test_over_time_matches_from_scratch():
+	n = 1 << 11
+	ds = make_zipf_dataset(n=n, vocab=256, a=1.2, seed=3)
+	counts = ds.value_counts()
+	qvals = list(ds.index.keys())[:120]
+
+	oracle = SealLeakageOracle(seal=SealRouter(n=n, alpha=2), dataset_index=ds.index, padding_x=2, rng_seed=9)
+	encT = oracle.build_encrypted_table()
+	obs = oracle.observe_query_stream(qvals)
+
+	qra = QueryRecoveryAttacker(counts, x=2, rng_seed=9)
+	dra = DatabaseRecoveryAttacker(counts, encT, x=2, rng_seed=9)
+	for t, (v, o) in enumerate(obs, start=1):
+		qra.observe(v, o)
+		dra.observe(v, o)
+		if t in (1, 10, 50, len(obs)):
+			assert qra.rate == query_recovery_attack(counts, obs[:t], x=2, rng_seed=9)
+			assert dra.rate == database_recovery_attack(counts, encT, obs[:t], x=2, rng_seed=9)
+
+	# QRSR only depends on volumes, so it is reproducible across routers (PRP keys are random per router)
+	points = [1, 10, 50, 500]
+	cfg = RunConfig(n=n, Z=4, alphas=[2], padding_x=2, rng_seed=9, checkpoints=CheckpointSpec(points=points))
+	ts = evaluate_over_time(ds.index, counts, qvals, cfg)
+	assert [t for t, _, _ in ts.series[2]] == [1, 10, 50, len(qvals)]
+	assert [q for _, q, _ in ts.series[2]] == [query_recovery_attack(counts, obs[:t], x=2, rng_seed=9) for t in (1, 10, 50, len(qvals))]
+
+	dense = evaluate_over_time(ds.index, counts, qvals, RunConfig(n=n, Z=4, alphas=[2], padding_x=2, rng_seed=9, every_t=True))
+	assert [t for t, _, _ in dense.series[2]] == list(range(1, len(qvals) + 1))
+	assert [q for _, q, _ in dense.series[2]][9] == ts.series[2][1][1]
+
 if __name__ == "__main__":
 	test_over_time_eval()
+	test_over_time_matches_from_scratch()
@@ -1,7 +1,9 @@
 # tests/test_prp.py
-from src.seal.prp import AffinePRP
+from src.seal.prp import AffinePRP, FeistelPRP
 import secrets
 
+import numpy as np
+
 def test_prp_small():
 	n = 1024
 	k = n.bit_length() - 1
@@ -17,5 +19,30 @@ def test_prp_small():
 
 	print("OK: PRP permutation + inverse test passed")
 
+def test_prp_batch_matches_scalar():
+	for k in [1, 10, 20, 40]:
+		prp = AffinePRP(key=secrets.token_bytes(16), k=k)
+		xs = np.random.default_rng(k).integers(0, 1 << k, size=2000, dtype=np.int64)
+		ys = prp.permute_many(xs)
+		assert ys.tolist() == [prp.permute(int(x)) for x in xs]
+		assert prp.inverse_many(ys).tolist() == xs.tolist()
+
+	print("OK: batch PRP matches scalar PRP")
+
+def test_feistel_prp():
+	# odd k exercises cycle walking
+	for k in [1, 5, 10, 11]:
+		prp = FeistelPRP(key=secrets.token_bytes(16), k=k)
+		xs = np.arange(1 << k, dtype=np.int64)
+		ys = prp.permute_many(xs)
+		assert sorted(ys.tolist()) == xs.tolist()
+		assert ys.tolist() == [prp.permute(int(x)) for x in xs]
+		assert prp.inverse_many(ys).tolist() == xs.tolist()
+		assert all(prp.inverse(int(y)) == int(x) for x, y in zip(xs, ys))
+
+	print("OK: Feistel PRP permutation + inverse test passed")
+
 if __name__ == "__main__":
 	test_prp_small()
+	test_prp_batch_matches_scalar()
+	test_feistel_prp()
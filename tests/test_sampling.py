@@ -0,0 +1,65 @@
+# tests/test_sampling.py
+import random
+
+from src.attacks.padding import next_power_of_x
+from src.attacks.sampling import SwapRemovePools
+from src.attacks.query_recovery import query_recovery_attack, build_padded_size_buckets
+from src.attacks.types import QueryObservation
+from src.workload.synthetic import make_zipf_dataset
+
+# Reference: the original filter-then-choice guessing loop
+def _qrsr_filtering(value_counts, observations, x, rng_seed):
+	rnd = random.Random(rng_seed)
+	buckets = build_padded_size_buckets(value_counts, x)
+	remaining = {v: True for v in value_counts}
+	correct = 0
+	for true_value, obs in observations:
+		candidates = [v for v in buckets.get(obs.observed_volume, []) if remaining[v]]
+		guess = rnd.choice(candidates) if candidates else None
+		if guess is not None:
+			remaining[guess] = False
+		correct += guess == true_value
+	return correct / len(observations)
+
+def test_swap_remove_pools():
+	pools = SwapRemovePools.from_groups({"a": range(10), "b": [7]})
+	rnd = random.Random(0)
+	drawn = [pools.draw("a", rnd) for _ in range(10)]
+	assert sorted(drawn) == list(range(10))
+	assert pools.live("a") == 0 and pools.draw("a", rnd) is None
+	assert pools.draw("missing", rnd) is None
+	assert pools.live_items("b") == [7] and pools.draw("b", rnd) == 7
+
+	# offset-grouped pools share the caller's list and never cross pool boundaries
+	items = [0, 0, 1, 1, 1, 2]
+	pools = SwapRemovePools.from_offsets(items, [0, 2, 5, 6, 6])
+	assert [pools.live(k) for k in range(4)] == [2, 3, 1, 0]
+	assert sorted(pools.draw(1, rnd) for _ in range(3)) == [1, 1, 1] and pools.draw(3, rnd) is None
+	assert sorted(items) == [0, 0, 1, 1, 1, 2]
+
+	# first draw matches rnd.choice on the untouched pool
+	pools = SwapRemovePools.from_groups({0: list(range(50))})
+	assert pools.draw(0, random.Random(3)) == random.Random(3).choice(list(range(50)))
+
+	# a batch draw is the same as that many single draws (same rnd calls, same pool state), capped at what is live
+	one = SwapRemovePools.from_groups({0: list(range(50)), 1: [9]})
+	many = SwapRemovePools.from_groups({0: list(range(50)), 1: [9]})
+	r1, r2 = random.Random(5), random.Random(5)
+	singles = [one.draw(0, r1) for _ in range(20)]
+	assert sorted(many.draw_many(0, 20, r2)) == sorted(singles) and r1.random() == r2.random()
+	assert sorted(many.live_items(0)) == sorted(one.live_items(0))
+	assert many.draw_many(1, 5, r2) == [9] and many.draw_many(1, 5, r2) == [] and many.draw_many("missing", 3, r2) == []
+
+def test_qrsr_distribution_matches_filtering():
+	ds = make_zipf_dataset(n=1 << 12, vocab=256, a=1.1, seed=4)
+	counts = ds.value_counts()
+	obs = [(v, QueryObservation(token_id=i, observed_volume=next_power_of_x(c, 4))) for i, (v, c) in enumerate(counts.items())]
+
+	new = [query_recovery_attack(counts, obs, x=4, rng_seed=s) for s in range(40)]
+	old = [_qrsr_filtering(counts, obs, x=4, rng_seed=s) for s in range(40)]
+	assert abs(sum(new) / 40 - sum(old) / 40) < 0.05
+
+if __name__ == "__main__":
+	test_swap_remove_pools()
+	test_qrsr_distribution_matches_filtering()
+	print("OK: sampling test passed")
@@ -0,0 +1,149 @@
+# tests/test_scheduler.py
+import json
+import os
+import re
+import shutil
+import tempfile
+
+from src.eval.master_runner import run_all
+from src.eval.scheduler import STAGE_CODE, Cell, ResultCache, cell_hash, cell_prp_key, code_version, expand_cells, run_cells
+
+def _tiny_config(run_name):
+	common = {"Z": 4, "alphas": [0, 2], "hot_fraction": 0.10, "hot_mass": 0.90, "working_set_fraction": 0.01}
+	return {
+		"run_name": run_name,
+		"toggles": {"perf": True, "over_time": True, "padding_sweep": True, "sessions": True},
+		"dataset": {"n": 1024, "vocab": 64, "zipf_a": 1.2, "seed": 1},
+		"perf": {**common, "n": 256, "patterns": ["uniform"], "num_ops": 50, "read_fraction": 0.5, "block_size_bytes": 64, "seed": 7},
+		"over_time": {**common, "patterns": ["uniform", "hot_set"], "num_queries": 40, "checkpoints": [10, 100], "seed": 9, "padding_x": None},
+		"padding_sweep": {**common, "xs": ["None", 2], "pattern": "uniform", "num_queries": 40, "seed": 11},
+		"sessions": {**common, "pattern": "zipf_like", "session_lengths": [5, 10], "num_sessions": 3, "seed": 13, "padding_x": None},
+	}
+
+def test_expand_cells_and_keys():
+	cfg = _tiny_config("x")
+	cells = expand_cells(cfg)
+	assert cells[:3] == [Cell("perf", ("uniform", "path_oram")), Cell("perf", ("uniform", 0)), Cell("perf", ("uniform", 2))]
+	assert len(cells) == 3 + 2 * 2 + 2 * 2 + 2 * 3
+	keys = {cell_prp_key(cfg, c) for c in cells}
+	assert len(keys) == len(cells) and cell_prp_key(cfg, cells[4]) == cell_prp_key(_tiny_config("y"), cells[4])
+
+def test_parallel_matches_serial():
+	cwd = os.getcwd()
+	with tempfile.TemporaryDirectory() as d:
+		os.chdir(d)
+		try:
+			outputs = {}
+			for workers in (1, 2):
+				cfg = _tiny_config(f"run_w{workers}")
+				path = os.path.join(d, f"cfg{workers}.json")
+				with open(path, "w", encoding="utf-8") as f:
+					json.dump(cfg, f)
+				run_all(path, workers=workers)
+				res = os.path.join(d, "out", cfg["run_name"], "results")
+				outputs[workers] = {
+					name: open(os.path.join(res, name), encoding="utf-8").read()
+					for name in ("over_time_uniform.json", "over_time_hot_set.json", "padding_sweep.json", "sessions.csv")
+				}
+				assert os.path.exists(os.path.join(res, "perf_uniform.csv"))
+				assert os.path.exists(os.path.join(res, "seal_telemetry_uniform_alpha2.csv"))
+			assert outputs[1] == outputs[2]
+
+			# perf bandwidth columns don't depend on scheduling either (only the wall-clock seconds do)
+			cfg = _tiny_config("cells")
+			perf = [c for c in expand_cells(cfg) if c.stage == "perf"]
+			out_root = os.path.join(d, "out", "run_w1")
+			a = run_cells(cfg, perf, out_root, workers=1)
+			b = run_cells(cfg, perf, out_root, workers=2)
+			for c in perf:
+				assert {k: v for k, v in a[c].items() if k != "seconds"} == {k: v for k, v in b[c].items() if k != "seconds"}
+		finally:
+			os.chdir(cwd)
+
+def test_result_cache_reuses_cells():
+	cfg = _tiny_config("cached")
+	cells = [c for c in expand_cells(cfg) if c.stage in ("over_time", "padding_sweep")]
+
+	# only a cell's own effective config matters: extending the alpha list keeps existing hashes
+	wider = _tiny_config("cached")
+	wider["over_time"]["alphas"] = [0, 2, 4]
+	changed = _tiny_config("cached")
+	changed["over_time"]["num_queries"] = 41
+	assert cell_hash(cfg, cells[0]) == cell_hash(wider, cells[0])
+	assert cell_hash(cfg, cells[0]) != cell_hash(changed, cells[0])
+	assert cell_hash(cfg, cells[-1]) == cell_hash(changed, cells[-1])
+
+	with tempfile.TemporaryDirectory() as d:
+		cache = ResultCache(os.path.join(d, "cache"))
+		first = run_cells(cfg, cells, d, cache=cache)
+		assert all(cache.get(cfg, c)[0] for c in cells)
+
+		# a rerun is served from the cache (poisoned entry proves nothing was recomputed), changed cells rerun
+		cache.put(cfg, cells[0], "from-cache")
+		again = run_cells(cfg, cells, d, cache=cache)
+		assert again[cells[0]] == "from-cache" and again[cells[1]] == first[cells[1]]
+		rerun = run_cells(changed, cells, d, cache=cache)
+		assert rerun[cells[0]] != "from-cache" and rerun[cells[-1]] == first[cells[-1]]
+
+def test_failed_cell_keeps_finished_cells():
+	cfg = _tiny_config("failing")
+	cfg["over_time"]["patterns"] = ["uniform", "no_such_pattern"]
+	cells = [c for c in expand_cells(cfg) if c.stage == "over_time"]
+
+	with tempfile.TemporaryDirectory() as d:
+		cache = ResultCache(os.path.join(d, "cache"))
+		try:
+			run_cells(cfg, cells, d, workers=2, cache=cache)
+			assert False, "expected ValueError"
+		except ValueError as e:
+			assert "unknown pattern" in str(e)
+		# the cells that succeeded were still cached, the failing ones were not
+		assert [cache.get(cfg, c)[0] for c in cells] == [c.key[0] == "uniform" for c in cells]
+
+def test_code_version_per_stage():
+	src = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+	with tempfile.TemporaryDirectory() as d:
+		root = os.path.join(d, "src")
+		shutil.copytree(src, root, ignore=shutil.ignore_patterns("__pycache__"))
+		before = {stage: code_version(stage, root) for stage in STAGE_CODE}
+
+		def edit(rel):
+			with open(os.path.join(root, rel), "a", encoding="utf-8") as f:
+				f.write("\n# edited\n")
+
+		# plotting and output assembly are not part of any cell's key
+		edit("eval/plotting.py")
+		edit("eval/master_runner.py")
+		assert {stage: code_version(stage, root) for stage in STAGE_CODE} == before
+
+		# an attack change invalidates the attack stages only, an ORAM change every stage
+		edit("attacks/prefix_frequency.py")
+		after = {stage: code_version(stage, root) for stage in STAGE_CODE}
+		assert after["perf"] == before["perf"] and after["padding_sweep"] != before["padding_sweep"]
+		edit("seal/router.py")
+		assert all(code_version(stage, root) != after[stage] for stage in STAGE_CODE)
+
+	# every src module a stage's code imports is covered by its list (scheduler.py imports every stage's runner)
+	def covered(stage, rel):
+		return any(rel == dep or rel.startswith(dep + "/") for dep in STAGE_CODE[stage])
+
+	for stage, deps in STAGE_CODE.items():
+		todo = [dep for dep in deps if dep.endswith(".py") and dep != "eval/scheduler.py"]
+		seen = set(todo)
+		while todo:
+			with open(os.path.join(src, todo.pop()), encoding="utf-8") as f:
+				text = f.read()
+			for mod in re.findall(r"^from src\.([\w.]+) import", text, flags=re.M):
+				rel = mod.replace(".", "/") + ".py"
+				assert covered(stage, rel), (stage, rel)
+				if rel not in seen:
+					seen.add(rel)
+					todo.append(rel)
+
+if __name__ == "__main__":
+	test_expand_cells_and_keys()
+	test_parallel_matches_serial()
+	test_result_cache_reuses_cells()
+	test_failed_cell_keeps_finished_cells()
+	test_code_version_per_stage()
+	print("OK: scheduler test passed")
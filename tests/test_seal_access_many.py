@@ -0,0 +1,57 @@
+# tests/test_seal_access_many.py
+import random
+from src.seal.seal_client import SealClient
+
+def test_seal_access_many():
+	n = 128
+	Z = 4
+	alpha = 3
+	seal = SealClient(n=n, Z=Z, alpha=alpha, default_value=0)
+
+	truth = {i: 0 for i in range(n)}
+	writes = []
+	for i in range(n):
+		v = random.randrange(1_000_000)
+		writes.append(("write", i, v))
+		truth[i] = v
+	assert seal.access_many(writes) == [None] * n
+
+	for _ in range(20):
+		batch = []
+		expected = []
+		for _ in range(40):
+			i = random.randrange(n)
+			if random.random() < 0.5:
+				v = random.randrange(1_000_000)
+				batch.append(("write", i, v))
+				truth[i] = v
+				expected.append(None)
+			else:
+				batch.append(("read", i))
+				expected.append(truth[i])
+
+		before = len(seal.access_log)
+		assert seal.access_many(batch) == expected
+		assert len(seal.access_log) == before + len(batch)
+
+	for sub in seal.sub_orams.values():
+		sub.assert_invariants(require_all_blocks_present=True)
+
+	# A bad request anywhere in the batch fails it before anything runs (no partially applied batch)
+	ids = sorted(range(n), key=lambda i: seal.route(i)[0])
+	first, last = ids[0], ids[-1]  # first and last sub-ORAM groups
+	assert seal.route(first)[0] != seal.route(last)[0]
+	for bad in (("delete", last), ("read", n), ("read", -1)):
+		before = len(seal.access_log)
+		try:
+			seal.access_many([("write", first, 12345), bad])
+			assert False, "expected ValueError"
+		except ValueError:
+			pass
+		assert len(seal.access_log) == before
+		assert seal.access("read", first) == truth[first]
+
+	print("OK: SEAL access_many test passed")
+
+if __name__ == "__main__":
+	test_seal_access_many()
@@ -0,0 +1,38 @@
+# tests/test_seal_lazy.py
+import random
+from src.seal.seal_client import SealClient
+
+def test_seal_lazy():
+	n = 256
+	Z = 4
+	alpha = 3
+
+	seal = SealClient(n=n, Z=Z, alpha=alpha, default_value=0)
+	assert len(seal.sub_orams) == 0
+
+	# Only touch ids routed to a single sub-ORAM
+	target = seal.route(0)[0]
+	ids = [i for i in range(n) if seal.route(i)[0] == target]
+
+	truth = {}
+	for _ in range(200):
+		i = random.choice(ids)
+		if random.random() < 0.5:
+			v = random.randrange(1_000_000)
+			seal.access("write", i, v)
+			truth[i] = v
+		else:
+			got = seal.access("read", i)
+			assert got == truth.get(i, 0)
+
+	assert list(seal.sub_orams.keys()) == [target]
+	seal.sub_orams[target].assert_invariants(require_all_blocks_present=False)
+
+	# Eager mode still builds every partition up front
+	eager = SealClient(n=n, Z=Z, alpha=alpha, default_value=0, lazy=False)
+	assert len(eager.sub_orams) == (1 << alpha)
+
+	print("OK: SEAL lazy sub-ORAM test passed")
+
+if __name__ == "__main__":
+	test_seal_lazy()
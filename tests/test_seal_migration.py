@@ -0,0 +1,135 @@
+# tests/test_seal_migration.py
+import os
+import random
+import tempfile
+
+from src.seal.seal_client import SealClient
+from src.seal.migration import MigrationBitmap, repartition, rotate_key
+
+def test_seal_repartition():
+	n = 128
+	seal = SealClient(n=n, Z=4, alpha=1, default_value=0)
+
+	truth = {}
+	for i in range(n):
+		v = random.randrange(1_000_000)
+		seal.access("write", i, v)
+		truth[i] = v
+
+	mig = repartition(seal, new_alpha=3, rate=0.5)
+	assert mig.new.params.m == 8
+
+	# Foreground traffic keeps working while blocks move in the background
+	ops = 0
+	while not mig.done:
+		i = random.randrange(n)
+		if random.random() < 0.5:
+			v = random.randrange(1_000_000)
+			mig.access("write", i, v)
+			truth[i] = v
+		else:
+			assert mig.access("read", i) == truth[i]
+		ops += 1
+		assert mig.num_migrated == min(n, ops // 2)
+
+	new = mig.finish()
+	for i in range(n):
+		assert new.access("read", i) == truth[i]
+	for sub in new.sub_orams.values():
+		sub.assert_invariants(require_all_blocks_present=True)
+
+	print("OK: SEAL repartition test passed")
+
+def test_seal_key_rotation():
+	n = 128
+	seal = SealClient(n=n, Z=4, alpha=2, default_value=0, log_capacity=4096)
+
+	truth = {}
+	for i in range(n):
+		v = random.randrange(1_000_000)
+		seal.access("write", i, v)
+		truth[i] = v
+
+	mig = rotate_key(seal, rate=0.25)
+	assert mig.new.router.prp_key != seal.router.prp_key
+
+	# Lazy: touching an unmigrated block moves it right away
+	mig.access("read", n - 1)
+	assert mig.migrated[n - 1] and mig.owner(n - 1) is mig.new
+
+	for _ in range(300):
+		i = random.randrange(n)
+		if random.random() < 0.5:
+			v = random.randrange(1_000_000)
+			mig.access("write", i, v)
+			truth[i] = v
+		else:
+			assert mig.access("read", i) == truth[i]
+
+	new = mig.finish()
+	assert mig.done and mig.migrated.nbytes == n // 8
+	for i in range(n):
+		assert new.access("read", i) == truth[i]
+
+	# Migration cost is visible in the access logs
+	old_split = seal.access_log.migration_bytes()
+	new_split = new.access_log.migration_bytes()
+	assert old_split["migration"] + new_split["migration"] == mig.migration_bytes > 0
+
+	print("OK: SEAL key rotation test passed")
+
+def test_migration_bitmap():
+	bm = MigrationBitmap(20)
+	for i in list(range(0, 9)) + [10]:
+		bm.set(i)
+	assert bm.count == 10
+	assert bm.next_clear(0) == 9 and bm.next_clear(10) == 11
+	for i in range(20):
+		bm.set(i)
+	assert bm.next_clear(0) == 20
+
+	# Long full runs (window search) and sparse holes agree with a plain scan
+	rng = random.Random(3)
+	n = 5003
+	bm = MigrationBitmap(n)
+	holes = {17, 18, 700, 3000, n - 1}
+	for i in range(n):
+		if i not in holes and rng.random() < 0.999:
+			bm.set(i)
+	for start in [rng.randrange(n) for _ in range(200)] + [0, n - 1, n]:
+		expected = next((i for i in range(start, n) if not bm[i]), n)
+		assert bm.next_clear(start) == expected
+
+	print("OK: migration bitmap test passed")
+
+# Arena-backed, spilling clients migrate into arena-backed, spilling layouts (never the old arena file or spill dir)
+def test_migration_keeps_storage():
+	n = 64
+	with tempfile.TemporaryDirectory() as d:
+		seal = SealClient(n=n, Z=4, alpha=1, arena=True, log_capacity=16, log_spill_dir=os.path.join(d, "log"))
+		for i in range(n):
+			seal.access("write", i, i * 3)
+
+		new = repartition(seal, new_alpha=2, rate=0.0).finish()
+		assert new.arena is not None and new.log_capacity == 16
+		assert new.log_spill_dir is not None and new.log_spill_dir != seal.log_spill_dir
+		assert any(name.startswith("access_log_") for name in os.listdir(new.log_spill_dir))
+		assert all(new.access("read", i) == i * 3 for i in range(n))
+
+		mapped = SealClient(n=n, Z=4, alpha=1, arena_path=os.path.join(d, "old.bin"))
+		for bad in (dict(arena_path=os.path.join(d, "old.bin")), dict(log_spill_dir=seal.log_spill_dir)):
+			try:
+				rotate_key(mapped if "arena_path" in bad else seal, **bad)
+				assert False, "expected ValueError"
+			except ValueError:
+				pass
+		mig = rotate_key(mapped, arena_path=os.path.join(d, "new.bin"))
+		assert mig.new.arena.path == os.path.join(d, "new.bin")
+
+	print("OK: migration storage test passed")
+
+if __name__ == "__main__":
+	test_seal_repartition()
+	test_seal_key_rotation()
+	test_migration_bitmap()
+	test_migration_keeps_storage()
@@ -0,0 +1,61 @@
+# tests/test_seal_non_pow2.py
+import random
+
+from src.seal.partitioning import make_seal_params, compare_to_pow2_baseline
+from src.seal.router import SealRouter
+from src.seal.seal_client import SealClient
+
+def test_non_pow2_routing():
+	for n in [100, 129, 1000]:
+		for alpha in [0, 1, 3]:
+			for prp in ["affine", "feistel"]:
+				router = SealRouter(n=n, alpha=alpha, prp=prp)
+				p = router.params
+				slots = [router.route(i) for i in range(n)]
+
+				# bijection onto the (unequal) sub-ORAM slots
+				assert len(set(slots)) == n
+				assert all(0 <= o < p.m and 0 <= l < p.local_size(o) for o, l in slots)
+				assert sum(p.local_size(i) for i in range(p.m)) == n
+
+				oram_index, local_id = router.route_many(list(range(n)))
+				assert list(zip(oram_index.tolist(), local_id.tolist())) == slots
+
+	print("OK: non-power-of-two routing test passed")
+
+def test_non_pow2_seal_access():
+	n = 100
+	seal = SealClient(n=n, Z=4, alpha=3, default_value=0, prp="feistel")
+	truth = {}
+	for i in range(n):
+		v = random.randrange(1_000_000)
+		seal.access("write", i, v)
+		truth[i] = v
+	for _ in range(300):
+		i = random.randrange(n)
+		assert seal.access("read", i) == truth[i]
+
+	for idx, sub in seal.sub_orams.items():
+		assert sub.cfg.n == seal.params.local_size(idx)
+		sub.assert_invariants(require_all_blocks_present=True)
+
+	print("OK: non-power-of-two SEAL access test passed")
+
+def test_non_pow2_params_and_overhead():
+	try:
+		make_seal_params(5, 2)  # sizes 2, 2, 1, 0 -> empty sub-ORAM
+		assert False, "expected ValueError"
+	except ValueError:
+		pass
+
+	cmp = compare_to_pow2_baseline(1_300_000, alpha=6)
+	assert cmp.padded.n == 1 << 21
+	assert cmp.position_map_ratio < 0.7
+	assert cmp.storage_ratio <= 1.0 and cmp.access_bytes_ratio <= 1.0
+
+	print("OK: non-power-of-two params/overhead test passed")
+
+if __name__ == "__main__":
+	test_non_pow2_routing()
+	test_non_pow2_seal_access()
+	test_non_pow2_params_and_overhead()
@@ -0,0 +1,33 @@
+# tests/test_seal_store.py
+from src.seal.seal_client import SealClient
+from src.workload.synthetic import make_zipf_dataset
+from src.workload.seal_store import SealRecordStore
+from src.eval.store_eval import evaluate_store_costs
+
+def test_seal_store():
+	n = 1 << 9
+	ds = make_zipf_dataset(n=n, vocab=64, a=1.2, seed=4)
+
+	seal = SealClient(n=n, Z=4, alpha=2, default_value=-1)
+	store = SealRecordStore(seal, padding_x=4, rng_seed=1)
+	_, load_bytes = store.load(ds)
+	assert load_bytes > 0
+
+	for value, ids in list(ds.index.items())[:20]:
+		res = store.query(value)
+		assert res.real_volume == ids.size
+		assert res.padded_volume >= res.real_volume
+		assert sorted(rid for rid, _ in res.records) == sorted(ids.tolist())
+		assert all(v == value for _, v in res.records)
+		assert res.bandwidth_bytes > 0 and res.seconds >= 0.0
+
+	rows = evaluate_store_costs(ds, list(ds.index.keys())[:10], Z=4, alphas=[0, 2], xs=[None, 4])
+	assert len(rows) == 4
+	for r in rows:
+		assert r.avg_padded_vol >= r.avg_real_vol
+		assert r.avg_query_bytes > 0
+
+	print("OK: SEAL record store test passed")
+
+if __name__ == "__main__":
+	test_seal_store()
@@ -0,0 +1,48 @@
+# tests/test_seal_telemetry.py
+import os
+import random
+import tempfile
+
+from src.eval.perf_runner import PerfConfig, run_perf_seal
+from src.seal.seal_client import SealClient
+
+def test_seal_telemetry():
+	n = 256
+	alpha = 3
+	seal = SealClient(n=n, Z=4, alpha=alpha, default_value=0)
+
+	for _ in range(500):
+		seal.access("read", random.randrange(n))
+
+	tel = seal.telemetry
+	counts = [0] * (1 << alpha)
+	stash_max = [0] * (1 << alpha)
+	total_bytes = 0
+	for e in seal.access_log:
+		counts[e.oram_index] += 1
+		stash_max[e.oram_index] = max(stash_max[e.oram_index], e.stash_size)
+		total_bytes += e.approx_bandwidth_bytes
+
+	assert tel.access_counts.tolist() == counts
+	assert tel.stash_max.tolist() == stash_max
+	assert int(tel.bytes_moved.sum()) == total_bytes
+	assert (tel.stash_percentile(50) <= tel.stash_percentile(99)).all()
+	assert (tel.stash_percentile(100) == tel.stash_max).all()
+	assert tel.imbalance() >= 0.0 and tel.max_over_mean() >= 1.0
+
+	# perf_runner exports one row per sub-ORAM
+	cfg = PerfConfig(n=n, Z=4, alphas=[alpha], num_ops=100, read_fraction=0.5, block_size_bytes=64, seed=1, pattern="hot_set")
+	with tempfile.TemporaryDirectory() as d:
+		row = run_perf_seal(cfg, alpha=alpha, telemetry_dir=d)
+		assert row.total_bandwidth_bytes > 0
+		assert abs(row.avg_bandwidth_bytes * row.num_ops - row.total_bandwidth_bytes) < 1e-6
+		path = os.path.join(d, f"seal_telemetry_hot_set_alpha{alpha}.csv")
+		with open(path, encoding="utf-8") as f:
+			lines = f.read().strip().splitlines()
+		assert len(lines) == 1 + (1 << alpha)
+		assert "imbalance_cv" in lines[0]
+
+	print("OK: SEAL telemetry test passed")
+
+if __name__ == "__main__":
+	test_seal_telemetry()
@@ -0,0 +1,30 @@
+# tests/test_synthetic_csr.py
+import numpy as np
+
+from src.workload.synthetic import make_zipf_dataset
+
+def test_synthetic_csr_index():
+	vocab = 512
+	ds = make_zipf_dataset(n=1 << 12, vocab=vocab, a=1.2, seed=5)
+
+	assert ds.csr_offsets.shape == (vocab + 1,)
+	assert ds.csr_offsets[-1] == ds.n == ds.csr_ids.size
+
+	# CSR, dict view and a brute-force scan all agree
+	for v in range(vocab):
+		expected = np.nonzero(ds.values == v)[0]
+		got = ds.csr_ids[ds.csr_offsets[v]:ds.csr_offsets[v + 1]]
+		assert np.array_equal(got, expected)
+		if expected.size:
+			assert np.array_equal(ds.index[v], expected)
+		else:
+			assert v not in ds.index
+
+	counts = ds.value_counts()
+	assert list(counts.keys()) == list(ds.index.keys())
+	assert all(counts[v] == ds.index[v].size for v in counts)
+
+	print("OK: synthetic CSR index test passed")
+
+if __name__ == "__main__":
+	test_synthetic_csr_index()